@@ -18,6 +18,27 @@ def zip_directory(directory):
                 zipf.write(file_path, os.path.relpath(file_path, start=os.path.join(directory, '..')))
 
 
+def is_zip_stale(directory):
+    """
+    Checks whether the zip of a directory is missing or older than any file that would be zipped.
+    :param directory: The zipped directory.
+    :type directory: str
+    :return: True if the directory needs to be zipped again, False otherwise.
+    :rtype: bool
+    """
+    zip_filename = f"{directory}.zip"
+    if not os.path.isfile(zip_filename):
+        return True
+
+    zip_mtime = os.path.getmtime(zip_filename)
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d != '__pycache__']  # Exclude __pycache__ directory, as in zip_directory
+        for file in files:
+            if os.path.getmtime(os.path.join(root, file)) > zip_mtime:
+                return True
+    return False
+
+
 if __name__ == "__main__":
     user_defined_folder = input("Enter the folder name within the current directory: ")
     if not user_defined_folder:
@@ -1,5 +1,5 @@
 from .addons import (ds_blender_lod_plug, ds_blender_slice_plug, ds_blender_xatlas_plug, ds_blender_baker_plug,
-                     ds_blender_cleanup_plug, ds_blender_combined_plugin)
+                     ds_blender_cleanup_plug, ds_blender_combined_plugin, ds_utils)
 
 
 bl_info = {
@@ -13,6 +13,10 @@ bl_info = {
 
 
 def register():
+    # Operators resolved and packages probed in a previous session may be stale
+    ds_utils.resolve_operator.cache_clear()
+    ds_utils.is_package_installed.cache_clear()
+
     ds_blender_cleanup_plug.register()
     ds_blender_slice_plug.register()
     ds_blender_lod_plug.register()
@@ -3,7 +3,8 @@ import sys
 import bpy
 
 from .ds_consts import CLEANUP_IDNAME, CLEANUP_LABEL, CLEANUP_PANEL_LABEL, CLEANUP_PANEL_IDNAME, EXTERNAL_FOLDER
-from .ds_utils import decimate_with_pyqmfr, keep_largest_component, clean_mesh_geometry, resolve_bmesh
+from .ds_utils import (decimate_with_pyqmfr, keep_largest_component, clean_mesh_geometry, resolve_bmesh,
+                       decimate_object, vertex_group_from_outer_boundary)
 
 ENV_IS_BLENDER = bpy.app.binary_path != ""
 
@@ -59,8 +60,6 @@ class MESH_OT_clean_mesh(bpy.types.Operator):
 
                 obj = resolve_bmesh(obj, bm) # Resolve Cached bmesh data before continuing
 
-                from .ds_utils import decimate_object, vertex_group_from_outer_boundary
-
                 target_ratio = max(min(initial_reduction / start_tri_cnt, 1.0), 0.0)
                 vg = vertex_group_from_outer_boundary(obj)
 
@@ -6,9 +6,9 @@ from datetime import datetime
 import bpy
 
 from .ds_consts import (CLEANUP_IDNAME, BAKE_IDNAME, UNWRAP_IDNAME, SLICE_IDNAME, COMB_IDNAME, LOD_IDNAME, COMB_LABEL,
-                        COMB_PANEL_LABEL, COMB_PANEL_IDNAME, ASCII_ART)
+                        COMB_PANEL_LABEL, COMB_PANEL_IDNAME)
 from .ds_blender_baker_plug import PluginBakerSettings
-from .ds_utils import clear_scene, launch_operator_by_name, merge_meshes
+from .ds_utils import clear_scene, launch_operator_by_name, merge_meshes, print_ascii_art
 
 
 bl_info = {
@@ -50,12 +50,13 @@ class OBJECT_OT_lod_pipeline(bpy.types.Operator):
             if additional_meshes:
                 base_mesh = merge_meshes(base_mesh, additional_meshes, return_bm=False)
 
-            # Apply rotation correction manually
-            rotation_matrix = base_mesh.matrix_world.to_euler()
-            rotation_matrix.x += math.radians(rotation_correction[0])
-            rotation_matrix.y += math.radians(rotation_correction[1])
-            rotation_matrix.z += math.radians(rotation_correction[2])
-            base_mesh.matrix_world = rotation_matrix.to_matrix().to_4x4()
+            # Apply rotation correction manually, unless there is none to apply
+            if any(rotation_correction):
+                rotation_matrix = base_mesh.matrix_world.to_euler()
+                rotation_matrix.x += math.radians(rotation_correction[0])
+                rotation_matrix.y += math.radians(rotation_correction[1])
+                rotation_matrix.z += math.radians(rotation_correction[2])
+                base_mesh.matrix_world = rotation_matrix.to_matrix().to_4x4()
 
             # If name change is needed, change the object's name
             if not keep_original_name:
@@ -135,11 +136,11 @@ class OBJECT_OT_lod_pipeline(bpy.types.Operator):
 
         # Execute Operators
         print("Current time: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        print(ASCII_ART["CLEANUP"])
+        print_ascii_art("CLEANUP")
         launch_operator_by_name(CLEANUP_IDNAME)
 
         print("Current time: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        print(ASCII_ART["SLICING"])
+        print_ascii_art("SLICING")
         launch_operator_by_name(SLICE_IDNAME)
 
         blend_file_path = os.path.join(export_fp_comb, "sliced_scene.blend")
@@ -156,7 +157,7 @@ class OBJECT_OT_lod_pipeline(bpy.types.Operator):
             part.select_set(True)
 
         print("Current time: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        print(ASCII_ART["LOD"])
+        print_ascii_art("LOD")
         launch_operator_by_name(LOD_IDNAME)
 
         objects_to_bake = {obj for obj in bpy.data.objects if obj.type == "MESH"}
@@ -165,7 +166,7 @@ class OBJECT_OT_lod_pipeline(bpy.types.Operator):
             obj.select_set(True)
 
         print("Current time: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        print(ASCII_ART["UNWRAPPING"])
+        print_ascii_art("UNWRAPPING")
         launch_operator_by_name(UNWRAP_IDNAME)
 
         original_mesh = import_and_prepare_original_mesh(import_fp_comb, rot_correction_comb, keep_original_name=False)
@@ -176,7 +177,7 @@ class OBJECT_OT_lod_pipeline(bpy.types.Operator):
             obj.select_set(True)
 
         print("Current time: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        print(ASCII_ART["BAKING"])
+        print_ascii_art("BAKING")
         launch_operator_by_name(BAKE_IDNAME)
 
         print("Current time: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
@@ -3,7 +3,8 @@ import sys
 import bpy
 
 from .ds_consts import LOD_IDNAME, LOD_LABEL, LOD_PANEL_IDNAME, LOD_PANEL_LABEL, EXTERNAL_FOLDER
-from .ds_utils import delete_loose_geometry, decimate_with_pyqmfr, clean_mesh_geometry
+from .ds_utils import (delete_loose_geometry, decimate_with_pyqmfr, clean_mesh_geometry, decimate_object,
+                       vertex_group_from_outer_boundary, bmesh_session)
 
 ENV_IS_BLENDER = bpy.app.binary_path != ""
 
@@ -116,15 +117,14 @@ class LODGenerator:
                 print("Could not import PyQmfr: ", e)
                 print("Fallback to Collapse via iter. Decimate Operator: ")
 
-                from .ds_utils import decimate_object, vertex_group_from_outer_boundary
-
                 vg = vertex_group_from_outer_boundary(new_obj)
 
                 decimate_object(new_obj, reduction_ratio, vg_name=vg, merge_threshold=0.00001)
 
-            bm = clean_mesh_geometry(new_obj, 0.0001, bm=bm, return_bm=True)
-
-            new_obj = delete_loose_geometry(new_obj, bm=bm, return_bm=False)
+            # Run the cleanup on one BMesh, which is only written back to the mesh at the end
+            with bmesh_session(new_obj, bm=bm) as bm:
+                clean_mesh_geometry(new_obj, 0.0001, bm=bm, return_bm=True)
+                delete_loose_geometry(new_obj, bm=bm, return_bm=True)
 
             # Update the previous LOD to the new object
             previous_lod = new_obj
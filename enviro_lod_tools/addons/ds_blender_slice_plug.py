@@ -1,17 +1,13 @@
-import gc
+import math
 
 import numpy as np
 import bpy
 import bmesh
-from bmesh.utils import edge_split, face_split
-from mathutils import Vector
+from mathutils import Matrix
 
 from enviro_lod_tools.addons.ds_utils import clean_mesh_geometry
 from .ds_consts import SLICE_IDNAME, SLICE_LABEL, SLICE_PANEL_LABEL, SLICE_PANEL_IDNAME
 
-X_VEC = Vector((1, 0, 0))  # Vec into X Direction
-Y_VEC = Vector((0, 1, 0))  # Vec into Y Direction
-
 bl_info = {
     "name": "Mesh Slicer",
     "author": "Nico Breycha",
@@ -24,90 +20,36 @@ bl_info = {
 }
 
 
-def calculate_intersection_factor(vert1, vert2, ip):
-    """
-    Calculate the intersection factor of a point on the edge defined by two vertices.
-    :param vert1: The first vertex of the edge
-    :type vert1: Vector or bmesh.types.BMVert
-    :param vert2: The second vertex of the edge
-    :type vert2: Vector or bmesh.types.BMVert
-    :param ip: The coordinates of the intersection point.
-    :type ip: Vector or bmesh.types.BMVert
-    :return: The intersection factor ``i_fac``, which ranges between 0.0001 and 0.9999. This value represents the
-             normalized position of the intersection point along the edge.
-    :rtype: float
-    :raises TypeError: If ``vert1`` or ``vert2`` or ``ip`` are not a Vector or a BMVert
+def mesh_vertex_coords(mesh):
     """
-    # Convert vertex positions / vectors to numpy arrays
-    if isinstance(vert1, bmesh.types.BMVert):
-        v1 = np.array(vert1.co)
-    elif isinstance(vert1, Vector):
-        v1 = np.array(vert1)
-    else:
-        raise TypeError("vert1 must be a Vector or a BMVert")
-
-    if isinstance(vert2, bmesh.types.BMVert):
-        v2 = np.array(vert2.co)
-    elif isinstance(vert2, Vector):
-        v2 = np.array(vert2)
-    else:
-        raise TypeError("vert2 must be a Vector or a BMVert")
-
-    if isinstance(ip, bmesh.types.BMVert):
-        ip = np.array(ip.co)
-    elif isinstance(ip, Vector):
-        ip = np.array(ip)
-    else:
-        raise TypeError("intersect_point must be a Vector or a BMVert")
-
-    # Calculate vectors
-    edge_vector = v2 - v1
-    intersect_vector = ip - v1
-
-    # Calculate the length of the edge_vector
-    edge_length = np.linalg.norm(edge_vector)
+    Read the vertex coordinates of a mesh into a contiguous (V, 3) float32 array.
 
-    # Avoid division by zero by checking if the edge_length is very small
-    if edge_length < 1e-8:
-        return 0.0
-
-    # Project intersect_vector onto edge_vector to find the scalar projection
-    i_fac = np.dot(intersect_vector, edge_vector) / edge_length**2
-
-    # Ensure e_fac is within the expected range / Avoid vertices are at the exact same position.
-    i_fac = max(0.0001, min(0.9999, i_fac))
-
-    return i_fac
+    :param mesh: The mesh to read the coordinates from.
+    :type mesh: bpy.types.Mesh
+    :return: The vertex coordinates.
+    :rtype: np.ndarray
+    """
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(-1, 3)
 
 
-def find_line_plane_intersection_point(line_vert_1, line_vert_2, plane_point, plane_normal):
-    """
-    Finds the intersection point of a line and a plane.
-
-    :param line_vert_1: First point on the line.
-    :type line_vert_1: Vector
-    :param line_vert_2: Second point on the line.
-    :type line_vert_2: Vector
-    :param plane_point: A point on the plane.
-    :type plane_point: Vector
-    :param plane_normal: The normal vector of the plane.
-    :type plane_normal: Vector
-    :return: The intersection point or None if there is no intersection.
-    :rtype: Vector or None
+def mesh_triangles(mesh):
     """
-    line_dir = line_vert_2 - line_vert_1
-    plane_d = plane_normal.dot(plane_point)
-    denom = plane_normal.dot(line_dir)
+    Tessellate a mesh and read its vertex coordinates and triangles.
 
-    # Check if the line is parallel to the plane
-    if abs(denom) < 1e-6:  # using a small tolerance to handle floating-point precision
-        return None
+    :param mesh: The mesh to tessellate.
+    :type mesh: bpy.types.Mesh
+    :return: The vertex coordinates as (V, 3) float32 array and the vertex indices of each triangle as (T, 3) int32
+             array.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    mesh.calc_loop_triangles()
 
-    t = (plane_d - plane_normal.dot(line_vert_1)) / denom
-    if 0.0 <= t <= 1.0:
-        return line_vert_1 + t * line_dir
+    tri_idx = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tri_idx)
 
-    return None
+    return mesh_vertex_coords(mesh), tri_idx.reshape(-1, 3)
 
 
 def calc_cut_list(mesh, target_amount_of_slices):
@@ -124,37 +66,30 @@ def calc_cut_list(mesh, target_amount_of_slices):
     :rtype: tuple[list[float], Vector]
     :raises ValueError: If the target amount of slices is not a perfect square (n^2)
     """
-    def calc_aabb(vertices):
+    def calc_aabb(coords):
         """
         Calculate the axis-aligned bounding box (AABB) of a Blender object.
 
-        :param vertices: The vertices of the object.
-        :type vertices: list[bpy.types.MeshVertex]
+        :param coords: The vertex coordinates of the object.
+        :type coords: np.ndarray
         :return: A tuple of numpy arrays (min_vec, max_vec), where each vector is represented
                  as numpy.float64 and contains the coordinates (x, y, z) of the minimum and
                  maximum points of the bounding box and the middle of the aabb.
         :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
         """
-        # Initialize min and max coordinates with extreme values
-        min_vec = np.array([np.inf, np.inf, np.inf], dtype=np.float64)
-        max_vec = np.array([-np.inf, -np.inf, -np.inf], dtype=np.float64)
-
-        # Update min and max coordinates by comparing each vertex
-        for vertex in vertices:
-            coords = np.array(vertex.co, dtype=np.float64)
-            min_vec = np.minimum(min_vec, coords)
-            max_vec = np.maximum(max_vec, coords)
+        min_vec = coords.min(axis=0).astype(np.float64)
+        max_vec = coords.max(axis=0).astype(np.float64)
 
         aabb_mid = (min_vec + max_vec) / 2
 
         return min_vec, max_vec, aabb_mid
 
-    no_slices = int(np.sqrt(target_amount_of_slices))
+    no_slices = math.isqrt(target_amount_of_slices)
     if no_slices * no_slices != target_amount_of_slices:
         raise ValueError("Target amount of slices must be a perfect square.")
 
     # Calculate the length of the longest side of the AABB
-    min_bound, max_bound, mid_point = calc_aabb(mesh.vertices)
+    min_bound, max_bound, mid_point = calc_aabb(mesh_vertex_coords(mesh))
     longest_side_idx = np.argmax(max_bound - min_bound)
     longest_side = max_bound[longest_side_idx] - min_bound[longest_side_idx]
 
@@ -166,147 +101,197 @@ def calc_cut_list(mesh, target_amount_of_slices):
     return relative_cuts, mid_point
 
 
-def better_bisect(mesh, cut_pos, direction, middle_point=None):
+def split_polygon(polygon, axis, cut_idx, cut_value, inter_coords):
     """
-    Slices the given mesh object at the specified position along the specified direction.
-    Functionally mirrors how the built-in bisect works, but keeps both the positive and negative half of the mesh.
-
-    See also: https://github.com/blender/blender/blob/main/source/blender/bmesh/tools/bmesh_bisect_plane.cc
-
-    :param mesh: The mesh object to slice.
-    :type mesh: bpy.types.Object
-    :param cut_pos: The position along the specified direction where the mesh should be sliced.
-    :type cut_pos: float
-    :param direction: The normal vector to slice the mesh along.
-    :type direction: Vector
-    :param middle_point: The middle point of the object's axis-aligned bounding box.
-    :type middle_point: Vector
-    :return: A tuple containing the two parts resulting from the slice, or None if the operation fails.
-    :rtype: tuple[bpy.types.Object]
+    Splits a convex polygon at an axis-aligned plane, keeping both sides (Sutherland-Hodgman for both sides at once).
+    Vertices on the plane belong to both sides.
+
+    Every polygon vertex is a key, which is either the index of an original vertex or the key of an intersection
+    vertex. Intersection keys are derived from the cut and the (unordered) edge they were created on, so neighbouring
+    polygons that share an edge also share the intersection vertex.
+
+    :param polygon: The vertex keys of the polygon.
+    :type polygon: list
+    :param axis: The axis the cutting plane is orthogonal to (0 = X, 1 = Y).
+    :type axis: int
+    :param cut_idx: The index of the cut along the axis.
+    :type cut_idx: int
+    :param cut_value: The position of the cutting plane along the axis.
+    :type cut_value: float
+    :param inter_coords: Maps all vertex keys to their coordinates. New intersection vertices are added to it.
+    :type inter_coords: dict
+    :return: The part of the polygon below and above the plane. A side is empty, if the polygon does not reach it.
+    :rtype: tuple[list, list]
     """
-    if middle_point is None:
-        middle_point = Vector((0, 0, 0))
+    below, above = [], []
 
-    direction = Vector(direction)
-    plane_point = Vector(middle_point + direction * cut_pos)
+    prev_key = polygon[-1]
+    prev_co = inter_coords[prev_key]
+    prev_d = prev_co[axis] - cut_value
 
-    bm = bmesh.new()
-    bm.from_mesh(mesh.data)
-    bmesh.ops.transform(bm, matrix=mesh.matrix_world, verts=bm.verts)
+    for key in polygon:
+        co = inter_coords[key]
+        d = co[axis] - cut_value
 
-    # Collect all intersected edges.
-    face_inters, verts_inters, verts_pos, verts_neg = set(), set(), set(), set()
+        # The edge from the previous to the current vertex crosses the plane
+        if (prev_d < 0 < d) or (d < 0 < prev_d):
+            inter_key = (axis, cut_idx, frozenset((prev_key, key)))
 
-    edge_snapshot = set(bm.edges)
+            if inter_key not in inter_coords:
+                t = prev_d / (prev_d - d)
+                inter_co = [p + t * (c - p) for p, c in zip(prev_co, co)]
+                inter_co[axis] = cut_value
+                inter_coords[inter_key] = tuple(inter_co)
 
-    bm.faces.ensure_lookup_table()
-    bm.verts.ensure_lookup_table()
+            below.append(inter_key)
+            above.append(inter_key)
 
-    for edge in edge_snapshot:
-        # Extract the edges vertices
-        vert1, vert2 = edge.verts
+        if d <= 0:
+            below.append(key)
+        if d >= 0:
+            above.append(key)
 
-        # Find a possible intersection of the edge and the cutting plane
-        intersect_point = find_line_plane_intersection_point(vert1.co, vert2.co, plane_point, direction)
+        prev_key, prev_co, prev_d = key, co, d
 
-        if intersect_point:
-            inter_fac = calculate_intersection_factor(vert1, vert2, intersect_point)
+    return (below if len(below) >= 3 else []), (above if len(above) >= 3 else [])
 
-            face_inters.update(edge.link_faces)
 
-            # Perform the split and store the newly created vertex
-            new_edge, inter_vert = edge_split(edge, vert1, inter_fac)
-            verts_inters.add(inter_vert)
-
-    del edge_snapshot
-    gc.collect()
-
-    # Split the faces
-    for face in face_inters:
-        split_verts = [vert for vert in face.verts if vert in verts_inters]
-
-        if len(split_verts) != 2:
-            print(f"Failed to split face {face.index}")
-            continue
-
-        new_face, new_loop = face_split(face, split_verts[0], split_verts[1])
+def slice_into_grid(coords, tri_idx, x_cuts, y_cuts):
+    """
+    Distributes the triangles of a mesh onto a grid of cells defined by the cut positions along X and Y.
+
+    Every triangle is assigned to its cell via a binary search on the cut positions. Only triangles straddling a cut
+    are clipped against the cutting planes, all other triangles are scattered into their cell as is.
+
+    :param coords: The vertex coordinates as (V, 3) array.
+    :type coords: np.ndarray
+    :param tri_idx: The vertex indices of each triangle as (T, 3) array.
+    :type tri_idx: np.ndarray
+    :param x_cuts: The ascending, absolute cut positions along the X-axis.
+    :type x_cuts: np.ndarray
+    :param y_cuts: The ascending, absolute cut positions along the Y-axis.
+    :type y_cuts: np.ndarray
+    :return: Maps the cell index (``x_cell * (len(y_cuts) + 1) + y_cell``) of every non-empty cell to its vertex
+             coordinates ((V, 3) float32), the loop start of each polygon and the vertex index of each loop.
+    :rtype: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]]
+    """
+    y_cell_count = len(y_cuts) + 1
+
+    # Cell of every vertex. Vertices on a cut belong to the upper cell.
+    vert_bx = np.searchsorted(x_cuts, coords[:, 0], side="right")
+    vert_by = np.searchsorted(y_cuts, coords[:, 1], side="right")
+
+    tri_bx = vert_bx[tri_idx]
+    tri_by = vert_by[tri_idx]
+    bx_min, bx_max = tri_bx.min(axis=1), tri_bx.max(axis=1)
+    by_min, by_max = tri_by.min(axis=1), tri_by.max(axis=1)
+
+    # Triangles with all vertices in one cell, grouped by their cell.
+    inside = (bx_min == bx_max) & (by_min == by_max)
+    inside_idx = tri_idx[inside]
+    inside_cells = bx_min[inside] * y_cell_count + by_min[inside]
+
+    order = np.argsort(inside_cells, kind="stable")
+    inside_cells = inside_cells[order]
+    inside_idx = inside_idx[order]
+    cells, starts = np.unique(inside_cells, return_index=True)
+    cell_tris = dict(zip(cells.tolist(), np.split(inside_idx, starts[1:])))
+
+    # Clip the straddling triangles, first into X strips and then into cells.
+    inter_coords = {}
+    cell_polys = {}
+
+    for tri, x_lo, x_hi, y_lo, y_hi in zip(tri_idx[~inside].tolist(),
+                                           bx_min[~inside].tolist(), bx_max[~inside].tolist(),
+                                           by_min[~inside].tolist(), by_max[~inside].tolist()):
+        for key in tri:
+            if key not in inter_coords:
+                inter_coords[key] = tuple(coords[key].tolist())
+
+        x_parts = []
+        rest = tri
+
+        for cut_idx in range(x_lo, x_hi):
+            below, rest = split_polygon(rest, 0, cut_idx, x_cuts[cut_idx], inter_coords)
+            if below:
+                x_parts.append((cut_idx, below))
+            if not rest:
+                break
+        else:
+            x_parts.append((x_hi, rest))
 
-        verts_pos.update(split_verts)
-        verts_neg.update(new_loop.edge.verts)
+        for bx, x_part in x_parts:
+            rest = x_part
 
-    del verts_inters
-    del face_inters
-    gc.collect()
+            for cut_idx in range(y_lo, y_hi):
+                below, rest = split_polygon(rest, 1, cut_idx, y_cuts[cut_idx], inter_coords)
+                if below:
+                    cell_polys.setdefault(bx * y_cell_count + cut_idx, []).append(below)
+                if not rest:
+                    break
+            else:
+                cell_polys.setdefault(bx * y_cell_count + y_hi, []).append(rest)
 
-    # We MUST update the indices, otherwise new faces and vertices are unknown when rebuilding the new meshes.
-    bm.faces.index_update()
-    bm.verts.index_update()
+    empty_tris = np.empty((0, 3), dtype=tri_idx.dtype)
+    grid = {}
 
-    # Create vertex maps from the old vertices to the new vertices, sorted by the side they are on.
-    for vert in bm.verts:
-        if (vert.co - plane_point).dot(direction) >= 0:
-            verts_pos.add(vert)
-        else:
-            verts_neg.add(vert)
+    for cell in sorted(cell_tris.keys() | cell_polys.keys()):
+        tris = cell_tris.get(cell, empty_tris)
+        polys = cell_polys.get(cell, [])
 
-    # Create new bmeshes for the positive and negative half of the mesh
-    bm_pos = bmesh.new()
-    bm_neg = bmesh.new()
+        # Original vertices are mapped to local indices via a sorted lookup, intersection vertices are appended.
+        orig_keys = [key for poly in polys for key in poly if isinstance(key, int)]
+        new_keys = list(dict.fromkeys(key for poly in polys for key in poly if not isinstance(key, int)))
 
-    # Create and map old vertex indices to new vertices in bm_pos and bm_neg
-    pos_map = {vert.index: bm_pos.verts.new(vert.co) for vert in verts_pos}
-    neg_map = {vert.index: bm_neg.verts.new(vert.co) for vert in verts_neg}
+        used = np.unique(np.concatenate((tris.ravel(), np.asarray(orig_keys, dtype=tri_idx.dtype))))
+        local = dict(zip(orig_keys, np.searchsorted(used, orig_keys).tolist()))
+        local.update((key, len(used) + i) for i, key in enumerate(new_keys))
 
-    # Store original vertex normals
-    original_normals = {v.index: v.normal.copy() for v in bm.verts}
+        cell_coords = np.concatenate((coords[used],
+                                      np.array([inter_coords[key] for key in new_keys],
+                                               dtype=np.float32).reshape(-1, 3)))
 
-    # Transfer Normals. NOTE: From here on we should not call "recalculate_normals" anymore!!
-    for old_index, new_vert in pos_map.items():
-        new_vert.normal = original_normals[old_index]
+        poly_loops = [local[key] for poly in polys for key in poly]
+        poly_sizes = [len(poly) for poly in polys]
 
-    for old_index, new_vert in neg_map.items():
-        new_vert.normal = original_normals[old_index]
+        loop_verts = np.concatenate((np.searchsorted(used, tris.ravel()), poly_loops)).astype(np.int32)
+        loop_sizes = np.concatenate((np.full(len(tris), 3), poly_sizes)).astype(np.int32)
+        loop_starts = np.concatenate(([0], np.cumsum(loop_sizes)[:-1])).astype(np.int32)
 
-    double_faces = 0
+        grid[cell] = cell_coords, loop_starts, loop_verts
 
-    # Recreate the faces in bm_pos and bm_neg
-    for face in bm.faces:
-        pos_face_verts = [pos_map[vert.index] for vert in face.verts if vert.index in pos_map]
-        neg_face_verts = [neg_map[vert.index] for vert in face.verts if vert.index in neg_map]
+    return grid
 
-        try:
-            if len(pos_face_verts) == len(face.verts):
-                bm_pos.faces.new(pos_face_verts)
-            elif len(neg_face_verts) == len(face.verts):
-                bm_neg.faces.new(neg_face_verts)
-        except ValueError as err:
-            print(f"Failed to create face {face.index}: {err}")
-            double_faces += 1
-            pass
 
-    bm.free()
-    del verts_pos
-    del verts_neg
-    gc.collect()
+def mesh_from_polygons(name, coords, loop_starts, loop_verts):
+    """
+    Create a new mesh directly from flat vertex and polygon arrays.
+
+    :param name: The name of the new mesh.
+    :type name: str
+    :param coords: The vertex coordinates as (V, 3) float32 array.
+    :type coords: np.ndarray
+    :param loop_starts: The index of the first loop of each polygon.
+    :type loop_starts: np.ndarray
+    :param loop_verts: The vertex index of each loop.
+    :type loop_verts: np.ndarray
+    :return: The new mesh.
+    :rtype: bpy.types.Mesh
+    """
+    mesh = bpy.data.meshes.new(name)
 
-    # Convert bmesh to mesh
-    mesh_data_pos = bpy.data.meshes.new(mesh.name + "_pos")
-    bm_pos.to_mesh(mesh_data_pos)
-    bm_pos.free()
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.ravel())
 
-    mesh_data_neg = bpy.data.meshes.new(mesh.name + "_neg")
-    bm_neg.to_mesh(mesh_data_neg)
-    bm_neg.free()
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts)
 
-    # Create new objects
-    mesh_pos = bpy.data.objects.new(mesh.name + "_pos", mesh_data_pos)
-    mesh_neg = bpy.data.objects.new(mesh.name + "_neg", mesh_data_neg)
+    mesh.polygons.add(len(loop_starts))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
 
-    # Link objects to the scene
-    bpy.context.collection.objects.link(mesh_pos)
-    bpy.context.collection.objects.link(mesh_neg)
+    mesh.update(calc_edges=True)
 
-    return mesh_pos, mesh_neg
+    return mesh
 
 
 class MESH_OT_quadrant_slicer(bpy.types.Operator):
@@ -314,15 +299,6 @@ class MESH_OT_quadrant_slicer(bpy.types.Operator):
     bl_idname = SLICE_IDNAME
     bl_label = SLICE_LABEL
 
-    @staticmethod
-    def remove_part(part):
-        """Removes the mesh part from the scene."""
-        # Unlink the original mesh
-        bpy.context.collection.objects.unlink(part)
-
-        # Delete the original mesh data
-        bpy.data.meshes.remove(part.data)
-
     @staticmethod
     def recalculate_normals(mesh):
         """Recalculates the normals of the mesh."""
@@ -354,67 +330,45 @@ class MESH_OT_quadrant_slicer(bpy.types.Operator):
             self.report({'ERROR'}, "Number of modules must be greater than 0.")
             return {'CANCELLED'}
 
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+        # Apply the transform on the data directly, instead of going through the operator
+        obj.data.transform(obj.matrix_world)
+        obj.matrix_world = Matrix.Identity(4)
 
         try:
             cut_list, aabb_middle = calc_cut_list(obj.data, number_of_modules)
         except ValueError:
-            self.report({'ERROR'}, "Number of modules must be a power of two.")
+            self.report({'ERROR'}, "Number of modules must be a perfect square.")
             return {'CANCELLED'}
 
-        x_sliced_meshes = []
+        if not cut_list:
+            self.report({'INFO'}, "Slicing completed")
+            return {'FINISHED'}
 
-        for part in x_sliced_meshes:
-            print(f"Part: {part.name}")
-        xy_sliced_meshes = []
+        # Triangulate once and distribute all triangles onto the grid in a single pass.
+        cuts = np.asarray(cut_list, dtype=np.float64)
+        coords, tri_idx = mesh_triangles(obj.data)
+        grid = slice_into_grid(coords, tri_idx, aabb_middle[0] + cuts, aabb_middle[1] + cuts)
+        del coords, tri_idx
 
-        for part in xy_sliced_meshes:
-            print(f"Part: {part.name}")
-
-        next_part_to_cut = obj
-
-        for idx, cut_pos in enumerate(cut_list):
-            pos_part, neg_part = better_bisect(next_part_to_cut, cut_pos, X_VEC, aabb_middle)
-            x_sliced_meshes.append(neg_part)
-
-            # Set next part in operation active, since we unlink the previous part
-            bpy.context.view_layer.objects.active = pos_part
-
-            # Remove the original mesh
-            self.remove_part(next_part_to_cut)
-
-            if idx == len(cut_list) - 1:
-                x_sliced_meshes.append(pos_part)
-            else:
-                next_part_to_cut = pos_part
-
-        for x_part in x_sliced_meshes:
-            next_part_to_cut = x_part
-
-            for idx, cut_pos in enumerate(cut_list):
-                pos_part, neg_part = better_bisect(next_part_to_cut, cut_pos, Y_VEC, aabb_middle)
-                xy_sliced_meshes.append(neg_part)
-
-                # Set next part in operation active, since we unlink the previous part
-                bpy.context.view_layer.objects.active = pos_part
+        # Without faces there is nothing to slice, keep the original object
+        if not grid:
+            self.report({'WARNING'}, "Mesh has no faces to slice.")
+            return {'CANCELLED'}
 
-                # Remove the original mesh
-                self.remove_part(next_part_to_cut)
+        # Remove the original mesh
+        base_name = obj.name
+        bpy.context.collection.objects.unlink(obj)
+        bpy.data.meshes.remove(obj.data)
 
-                if idx == len(cut_list) - 1:
-                    xy_sliced_meshes.append(pos_part)
-                else:
-                    next_part_to_cut = pos_part
+        # Create the final mesh parts, numbered consecutively as empty cells create no part.
+        for part_number, (cell_coords, loop_starts, loop_verts) in enumerate(grid.values(), start=1):
+            part_name = f"{base_name}_{part_number:03d}"
+            part = bpy.data.objects.new(part_name, mesh_from_polygons(part_name, cell_coords, loop_starts, loop_verts))
+            bpy.context.collection.objects.link(part)
 
-                next_part_to_cut = pos_part
+            clean_mesh_geometry(part, 0.00001, return_bm=False)
 
-        # Recalculate normals for the final mesh parts
-        for i, part in enumerate(xy_sliced_meshes):
-            part = clean_mesh_geometry(part, 0.00001, return_bm=False)
-            part.name = part.name.replace("_neg", "")
-            part.name = part.name.replace("_pos", "")
-            suffix = f"_{i + 1:03d}"
-            part.name = part.name + suffix
+        bpy.context.view_layer.objects.active = part
 
         self.report({'INFO'}, "Slicing completed")
         return {'FINISHED'}
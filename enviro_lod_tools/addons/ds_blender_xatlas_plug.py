@@ -15,23 +15,60 @@ they fail to find the necessary Blender modules.
 To mitigate this issue, we manipulate `sys.path` before creating the multiprocessing pool,
 ensuring that child processes inherit a clean `sys.path` without Blender-specific paths.
 This allows the subprocesses to import the required modules without interference!
+On Linux and macOS the workers are forked instead, so they inherit the already imported modules and the workaround
+is not needed there.
 For more details on this issue and the workaround, please refer to the following discussion:
 
 https://github.com/TylerGubala/blenderpy/issues/23
 """
 
+import os
 import sys
+import atexit
+import hashlib
+import tempfile
 import multiprocessing
+from multiprocessing import shared_memory
 
 import numpy as np
 import bpy
 import bmesh
 
+from .ds_utils import ensure_package_installed
 from .ds_consts import UNWRAP_IDNAME, UNWRAP_LABEL, UNWRAP_PANEL_LABEL, UNWRAP_PANEL_IDNAME, EXTERNAL_FOLDER
 
 
 ENV_IS_BLENDER = bpy.app.binary_path != ""
 
+# Number of meshes sent to a worker per task, to amortize the IPC overhead on scenes with many small meshes
+TASK_CHUNK_SIZE = 8
+
+# Maximum number of faces per task. Larger meshes are sent alone, so they don't hold back the small ones in their chunk
+TASK_FACE_BUDGET = 50_000
+
+# Forked workers inherit the imported modules of Blender's process, spawn is the only option on Windows
+MP_CONTEXT = multiprocessing.get_context("spawn" if sys.platform == "win32" else "fork")
+
+if MP_CONTEXT.get_start_method() == "spawn":
+    # Spawn the workers from Blender's bundled Python interpreter, not the Blender executable
+    MP_CONTEXT.set_executable(sys.executable)
+
+# Results of previous unwraps, keyed by a hash of the input geometry
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "enviro_lod_tools_xatlas_cache")
+
+# Maximum size of the cache in bytes, beyond that the least recently used results are deleted
+CACHE_SIZE_LIMIT = 512 << 20
+
+# Whether xatlas has been imported in this session
+_XATLAS_READY = False
+
+# Worker pool, created on first use and kept alive for the rest of the session
+_POOL = None
+_POOL_SIZE = 0
+
+# Number of faces that justify one worker process, below that the process startup and IPC outweigh the parallelism
+FACES_PER_WORKER = 200_000
+
 bl_info = {
     "name": "XAtlas Unwrapper",
     "author": "Nico Breycha",
@@ -43,42 +80,326 @@ bl_info = {
 }
 
 
+def _check_input_layout(vertices, faces):
+    """
+    Checks that the input arrays match the layout xatlas expects, so its bindings can read them without a copy:
+    C-contiguous float32 vertex positions of shape (V, 3) and uint32 triangle indices of shape (F, 3).
+    The foreach_get extraction in the operator produces exactly this layout.
+
+    :param vertices: The vertex positions.
+    :type vertices: np.ndarray
+    :param faces: The vertex indices of the triangles.
+    :type faces: np.ndarray
+    """
+    assert vertices.flags["C_CONTIGUOUS"] and vertices.dtype == np.float32 and vertices.shape[1:] == (3,)
+    assert faces.flags["C_CONTIGUOUS"] and faces.dtype == np.uint32 and faces.shape[1:] == (3,)
+
+
 def _process_mesh_single_process(data):
     obj_name, vertices, faces = data
     try:
         import xatlas
-        # Parametrize the mesh using xatlas
-        vmapping, indices, uvs = xatlas.parametrize(vertices, faces)
-        return obj_name, vmapping, indices, uvs, None
+
+        # Parametrize the mesh using xatlas, the input layout must not force a copy in the bindings
+        _check_input_layout(vertices, faces)
+        _, indices, uvs = xatlas.parametrize(vertices, faces)
+        return obj_name, indices, uvs, None
     except Exception as e:
         # Return the exception message to the main process
-        return obj_name, None, None, None, str(e)
+        return obj_name, None, None, str(e)
+
+
+def _share_array(arr):
+    """
+    Copies an array into a new shared memory segment, so worker processes can read it without pickling.
+
+    :param arr: The array to share.
+    :type arr: np.ndarray
+    :return: The shared memory segment (owned by the caller) and the descriptor to attach to it.
+    :rtype: tuple[shared_memory.SharedMemory, tuple[str, str, tuple[int, ...]]]
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, arr.dtype.str, arr.shape)
+
+
+def _attach_array(descriptor):
+    """
+    Attaches to an array shared via :func:`_share_array`.
+
+    :param descriptor: The descriptor returned by :func:`_share_array`.
+    :type descriptor: tuple[str, str, tuple[int, ...]]
+    :return: The attached shared memory segment and a view of the array in it.
+    :rtype: tuple[shared_memory.SharedMemory, np.ndarray]
+    """
+    name, dtype, shape = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker():
+    """
+    Initializes a worker of the unwrap pool, by importing xatlas once per process.
+    A failing import is left to the tasks to report, as a raising initializer would make the pool respawn workers
+    indefinitely.
+    """
+    if MP_CONTEXT.get_start_method() == "spawn":
+        # Remove Blender-specific paths
+        sys.path = [p for p in sys.path if "blender" not in p.lower() and "scripts" not in p.lower()]
 
+    try:
+        import xatlas
+    except ImportError:
+        pass
+
+
+def _cache_key(vertices, faces):
+    """
+    Hashes the input geometry of an unwrap.
+
+    :param vertices: The vertex positions.
+    :type vertices: np.ndarray
+    :param faces: The vertex indices of the triangles.
+    :type faces: np.ndarray
+    :return: The hex digest identifying the geometry.
+    :rtype: str
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(vertices).data)
+    digest.update(np.ascontiguousarray(faces).data)
+    return digest.hexdigest()
+
+
+def _load_cached_result(key):
+    """
+    Loads the cached unwrap result of a geometry.
+
+    :param key: The cache key of the geometry.
+    :type key: str
+    :return: The cached (indices, uvs) or None on a cache miss.
+    :rtype: tuple[np.ndarray, np.ndarray] | None
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{key}.npz")
+    try:
+        with np.load(cache_path) as cached:
+            result = cached["indices"], cached["uvs"]
+    except (OSError, KeyError, ValueError):
+        return None
 
-def _process_mesh_multiprocessing(data):
-    obj_name, vertices, faces = data
+    # Mark the result as recently used, so pruning the cache keeps it
     try:
-        # Save original sys.path
-        original_sys_path = sys.path.copy()
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return result
+
+
+def _store_cached_result(key, indices, uvs):
+    """
+    Stores the unwrap result of a geometry in the cache. Failing to write the cache is not an error.
+
+    :param key: The cache key of the geometry.
+    :type key: str
+    :param indices: The output vertex indices of the triangles.
+    :type indices: np.ndarray
+    :param uvs: The UV coordinates of the output vertices.
+    :type uvs: np.ndarray
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+        # Write to a temporary file first, so a concurrent reader never sees a partial file
+        tmp_path = os.path.join(CACHE_DIR, f"{key}.{os.getpid()}.tmp.npz")
+        np.savez(tmp_path, indices=indices, uvs=uvs)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, f"{key}.npz"))
+    except OSError as e:
+        print(f"Failed to cache the unwrap result: {e}")
+
+
+def _prune_cache():
+    """
+    Deletes the least recently used unwrap results until the cache fits into CACHE_SIZE_LIMIT.
+    Failing to prune the cache is not an error.
+    """
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                     for entry in entries if entry.name.endswith(".npz") and not entry.name.endswith(".tmp.npz")
+                     and entry.is_file()]
+    except OSError:
+        return
+
+    cache_size = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if cache_size <= CACHE_SIZE_LIMIT:
+            break
+        try:
+            os.remove(path)
+            cache_size -= size
+        except OSError as e:
+            print(f"Failed to prune the unwrap cache: {e}")
+
+
+def _ensure_xatlas():
+    """
+    Imports xatlas on first use, installing it if it is missing.
+
+    :return: Whether xatlas is available.
+    :rtype: bool
+    """
+    global _XATLAS_READY
+
+    if _XATLAS_READY:
+        return True
+
+    if ENV_IS_BLENDER and EXTERNAL_FOLDER not in sys.path:
+        sys.path.append(EXTERNAL_FOLDER)
+
+    try:
+        import xatlas
+    except ImportError:
+        ensure_package_installed("xatlas")
+
+        try:
+            import xatlas
+        except ImportError:
+            return False
+
+    _XATLAS_READY = True
+    return True
+
+
+def _get_pool(processes):
+    """
+    Returns the persistent unwrap pool, creating it on first use.
+    The pool is recreated, if it has fewer workers than requested.
+
+    :param processes: The number of worker processes needed.
+    :type processes: int
+    :return: The worker pool.
+    :rtype: multiprocessing.pool.Pool
+    """
+    global _POOL, _POOL_SIZE
+
+    if _POOL is not None and _POOL_SIZE < processes:
+        _close_pool()
+
+    if _POOL is None:
+        # xatlas is already imported by _ensure_xatlas at this point, so forked workers inherit it
+        _POOL = MP_CONTEXT.Pool(processes=processes, initializer=_init_worker)
+        _POOL_SIZE = processes
+
+    return _POOL
+
+
+def _close_pool(terminate=False):
+    """
+    Shuts down the persistent unwrap pool, if it was created.
+
+    :param terminate: Whether to stop the workers immediately, instead of letting them finish their tasks.
+    :type terminate: bool
+    """
+    global _POOL
+
+    if _POOL is None:
+        return
+
+    if terminate:
+        _POOL.terminate()
+    else:
+        _POOL.close()
+    _POOL.join()
+    _POOL = None
+
+
+atexit.register(_close_pool)
 
-        # Remove Blender-specific paths
-        sys.path = [p for p in sys.path if "blender" not in p.lower() and "scripts" not in p.lower()]
 
-        import xatlas  # Import xatlas in the subprocess
+def _pack_array(arr):
+    """
+    Packs an array into raw bytes, which pickle as a single memcpy.
 
-        # Restore sys.path
-        sys.path = original_sys_path
+    :param arr: The array to pack.
+    :type arr: np.ndarray
+    :return: The raw bytes, dtype string and shape of the array.
+    :rtype: tuple[bytes, str, tuple[int, ...]]
+    """
+    return arr.tobytes(), arr.dtype.str, arr.shape
 
-        # Parametrize the mesh using xatlas
-        vmapping, indices, uvs = xatlas.parametrize(vertices, faces)
-        # Convert results to lists to make them picklable
-        vmapping = vmapping.tolist()
-        indices = indices.tolist()
-        uvs = uvs.tolist()
-        return obj_name, vmapping, indices, uvs, None
+
+def _unpack_array(packed):
+    """
+    Restores an array packed by :func:`_pack_array`, without copying the bytes.
+
+    :param packed: The packed array.
+    :type packed: tuple[bytes, str, tuple[int, ...]]
+    :return: A read-only view of the array.
+    :rtype: np.ndarray
+    """
+    buffer, dtype, shape = packed
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+def _process_mesh_multiprocessing(data):
+    obj_name, vertices_desc, faces_desc = data
+    segments = []
+    try:
+        import xatlas  # Already imported by _init_worker, so this is only a lookup
+
+        # Read the input arrays straight from the shared memory of the main process
+        shm, vertices = _attach_array(vertices_desc)
+        segments.append(shm)
+        shm, faces = _attach_array(faces_desc)
+        segments.append(shm)
+
+        # Parametrize the mesh using xatlas, the input layout must not force a copy in the bindings
+        _check_input_layout(vertices, faces)
+        _, indices, uvs = xatlas.parametrize(vertices, faces)
+        del vertices, faces
+
+        # Send the results back as raw bytes, which pickle far cheaper than lists or arrays
+        return obj_name, _pack_array(indices), _pack_array(uvs), None
     except Exception as e:
         # Return the exception message to the main process
-        return obj_name, None, None, None, str(e)
+        return obj_name, None, None, str(e)
+    finally:
+        for shm in segments:
+            shm.close()
+
+
+def _chunk_tasks(tasks, face_counts):
+    """
+    Groups the unwrap tasks into chunks, largest meshes first (longest processing time scheduling).
+    A chunk holds up to TASK_CHUNK_SIZE meshes and is closed early, once it exceeds TASK_FACE_BUDGET faces.
+
+    :param tasks: The unwrap tasks.
+    :type tasks: list[tuple]
+    :param face_counts: The face count of the mesh of each task.
+    :type face_counts: list[int]
+    :return: The chunks, in order of descending face count.
+    :rtype: list[list[tuple]]
+    """
+    chunks = []
+    chunk = []
+    chunk_faces = 0
+
+    for face_count, task in sorted(zip(face_counts, tasks), key=lambda entry: -entry[0]):
+        if chunk and (len(chunk) == TASK_CHUNK_SIZE or chunk_faces + face_count > TASK_FACE_BUDGET):
+            chunks.append(chunk)
+            chunk = []
+            chunk_faces = 0
+
+        chunk.append(task)
+        chunk_faces += face_count
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def _process_mesh_chunk(chunk):
+    return [_process_mesh_multiprocessing(data) for data in chunk]
 
 
 class MESH_OT_unwrap_xatlas(bpy.types.Operator):
@@ -88,84 +409,164 @@ class MESH_OT_unwrap_xatlas(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
+        if not _ensure_xatlas():
+            self.report({"ERROR"}, "xatlas is not available")
+            return {"CANCELLED"}
+
         cnt_fail = 0
         mesh_data_list = []
         obj_map = {}
         messages = []
 
-        # Prepare data for multiprocessing
+        # Collect the meshes to process
+        meshes = []
         for obj in context.selected_objects:
             if obj.type != "MESH":
                 messages.append(f"Skipping {obj.name}: not a mesh")
                 cnt_fail += 1
                 continue
 
-            mesh = obj.data
-
             # Skip meshes with 0 polygons
-            if len(mesh.polygons) == 0:
+            if len(obj.data.polygons) == 0:
                 messages.append(f"Skipping {obj.name}: empty mesh")
                 continue
 
-            # Create a bmesh object and load the mesh data into it
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
-            bmesh.ops.triangulate(bm, faces=bm.faces[:])
+            meshes.append(obj)
+
+        # Extract all meshes into views of two shared buffers, instead of allocating arrays per mesh.
+        # Triangulating an n-gon yields n - 2 triangles, so the triangle count is known upfront.
+        vertex_counts = [len(obj.data.vertices) for obj in meshes]
+        face_counts = [len(obj.data.loops) - 2 * len(obj.data.polygons) for obj in meshes]
+        vertex_buffer = np.empty((sum(vertex_counts), 3), dtype=np.float32)
+        face_buffer = np.empty((sum(face_counts), 3), dtype=np.uint32)
+        vertex_offset = 0
+        face_offset = 0
+
+        # Prepare data for multiprocessing
+        for obj, vertex_count, face_count in zip(meshes, vertex_counts, face_counts):
+            mesh = obj.data
+
+            # Every polygon has at least 3 loops, so the mesh is all triangles exactly if this holds
+            if face_count != len(mesh.polygons):
+                # Create a bmesh object and load the mesh data into it
+                bm = bmesh.new()
+                bm.from_mesh(mesh)
+                bmesh.ops.triangulate(bm, faces=bm.faces[:])
+
+                # Write the triangulated bmesh back to the original mesh
+                bm.to_mesh(mesh)
+                mesh.update()
+                bm.free()
 
-            # Extract vertex positions and triangle faces from bmesh
-            vertices = np.array([v.co[:] for v in bm.verts], dtype=np.float32)
-            faces = np.array([[v.index for v in f.verts] for f in bm.faces], dtype=np.uint32)
+            # Extract vertex positions and triangle faces straight from the mesh buffers
+            mesh.calc_loop_triangles()
+
+            vertices = vertex_buffer[vertex_offset:vertex_offset + vertex_count]
+            mesh.vertices.foreach_get("co", vertices.reshape(-1))
+            vertex_offset += vertex_count
+
+            faces = face_buffer[face_offset:face_offset + face_count]
+            mesh.loop_triangles.foreach_get("vertices", faces.reshape(-1))
+            face_offset += face_count
 
             # Store data for processing
             mesh_data_list.append((obj.name, vertices, faces))
 
-            # Write the triangulated bmesh back to the original mesh
-            bm.to_mesh(mesh)
-            mesh.update()
-
             # Update the object map with the triangulated object
             obj_map[obj.name] = obj
 
-            bm.free()
-
         if not mesh_data_list:
             self.report({"WARNING"}, "No valid meshes to process")
             return {"CANCELLED"}
 
         total_meshes = len(mesh_data_list)
-        progress = 0
+
+        # Unwrap each distinct geometry once, reuse the results of geometry that was unwrapped before and only
+        # process the rest
+        results = []
+        cache_keys = {}
+        pending_list = []
+        instances = {}
+        unwrapped_by_key = {}
+        for obj_name, vertices, faces in mesh_data_list:
+            key = _cache_key(vertices, faces)
+
+            if key in unwrapped_by_key:
+                # Identical geometry (e.g. instanced tiles) gets the result of the first mesh
+                instances[unwrapped_by_key[key]].append(obj_name)
+                continue
+
+            unwrapped_by_key[key] = obj_name
+            instances[obj_name] = [obj_name]
+            cached = _load_cached_result(key)
+
+            if cached is None:
+                cache_keys[obj_name] = key
+                pending_list.append((obj_name, vertices, faces))
+            else:
+                results.append((obj_name, *cached, None))
+
+        progress = len(results)
 
         # Start the progress bar
         context.window_manager.progress_begin(0, total_meshes)
 
         # Save the original sys.path before importing bpy
         original_sys_path = sys.path.copy()
+        shared_segments = []
 
-        try:
-            # Restore sys.path to original before starting multiprocessing
-            sys.path = [p for p in original_sys_path if "blender" not in p.lower() and "scripts" not in p.lower()]
-
-            # Use multiprocessing Pool
-            multiprocessing.freeze_support()
+        # Scale the number of workers with the amount of work, not just the number of cores
+        face_counts = [len(faces) for _, _, faces in pending_list]
+        processes = min(max(1, min(os.cpu_count() or 1, sum(face_counts) // FACES_PER_WORKER)),
+                        len(pending_list))
 
-            with (multiprocessing.Pool() as pool):
-                # Map the processing function to the data
-                results = []
-                for result in pool.imap(_process_mesh_multiprocessing, reversed(mesh_data_list)):
-                    results.append(result)
+        try:
+            if len(pending_list) <= 1 or processes <= 1:
+                # A single mesh or worker is not worth the process hop, unwrap in-process instead
+                for data in pending_list:
+                    results.append(_process_mesh_single_process(data))
                     progress += 1
                     context.window_manager.progress_update(progress)
+            else:
+                if MP_CONTEXT.get_start_method() == "spawn":
+                    # Restore sys.path to original before starting multiprocessing
+                    sys.path = [p for p in original_sys_path
+                                if "blender" not in p.lower() and "scripts" not in p.lower()]
+
+                # Share the input arrays with the workers instead of pickling them into every task
+                tasks = []
+                for obj_name, vertices, faces in pending_list:
+                    vertices_shm, vertices_desc = _share_array(vertices)
+                    shared_segments.append(vertices_shm)
+                    faces_shm, faces_desc = _share_array(faces)
+                    shared_segments.append(faces_shm)
+                    tasks.append((obj_name, vertices_desc, faces_desc))
+
+                # Start the largest meshes first and let the small ones fill up the tail
+                chunks = _chunk_tasks(tasks, face_counts)
+
+                # Map the processing function to the chunks, in order of completion
+                pool = _get_pool(processes)
+                for chunk_results in pool.imap_unordered(_process_mesh_chunk, chunks, chunksize=1):
+                    for obj_name, indices, uvs, error in chunk_results:
+                        if error is None:
+                            indices, uvs = _unpack_array(indices), _unpack_array(uvs)
+                        results.append((obj_name, indices, uvs, error))
+
+                    progress += len(chunk_results)
+                    context.window_manager.progress_update(progress)
         except ImportError as e:
             # Multiprocessing not available (This is our fallback for using as plugin)
             self.report({"INFO"}, f"Multiprocessing not available: {e}")
-            results = []
             import datetime
-            for data in reversed(mesh_data_list):
+            for data in pending_list:
                 print(f"Unwrapping: {data[0]} with {len(data[1])} vertices at {datetime.datetime.now()}")
                 self.report({"INFO"}, f"Unwrapping: {data[0]} with {len(data[1])} vertices at {datetime.datetime.now()}")
 
                 results.append(_process_mesh_single_process(data))
         except Exception as e:
+            # Don't reuse a pool that might be broken
+            _close_pool(terminate=True)
             self.report({"ERROR"}, f"Multiprocessing failed: {e}")
             context.window_manager.progress_end()
             return {"CANCELLED"}
@@ -173,17 +574,28 @@ class MESH_OT_unwrap_xatlas(bpy.types.Operator):
             # Restore sys.path
             sys.path = original_sys_path
 
+            # Release the shared input arrays
+            for shm in shared_segments:
+                shm.close()
+                shm.unlink()
+
+        # Hand each result to all meshes sharing the unwrapped geometry
+        results = [(obj_name, *result[1:]) for result in results for obj_name in instances[result[0]]]
+
         # Apply results
         for result in results:
             obj_name = result[0]
-            if result[4]:
+            if result[3]:
                 # An error occurred during processing
-                error_message = result[4]
+                error_message = result[3]
                 messages.append(f"Failed to parametrize {obj_name}: {error_message}")
                 cnt_fail += 1
                 continue
 
-            vmapping, indices, uvs = result[1], result[2], result[3]
+            indices, uvs = result[1], result[2]
+
+            if obj_name in cache_keys:
+                _store_cached_result(cache_keys[obj_name], indices, uvs)
 
             obj = obj_map.get(obj_name)
             if not obj:
@@ -193,31 +605,20 @@ class MESH_OT_unwrap_xatlas(bpy.types.Operator):
 
             mesh = obj.data
 
-            # Create a new bmesh object and load the mesh data into it
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
-
             if not mesh.uv_layers:
-                uv_layer = bm.loops.layers.uv.new()
-            else:
-                uv_layer = bm.loops.layers.uv.active
+                mesh.uv_layers.new()
 
             # Convert data back to numpy arrays
-            indices = np.array(indices, dtype=np.uint32)
-            uvs = np.array(uvs, dtype=np.float32)
-
-            # Apply the new UV coordinates based on xatlas output
-            for i, face in enumerate(bm.faces):
-                loops = face.loops
-                tri_indices = indices[i]
-                for j, loop in enumerate(loops):
-                    new_index = tri_indices[j]
-                    loop[uv_layer].uv = (uvs[new_index][0], uvs[new_index][1])
-
-            # Write the changes back to the mesh and update
-            bm.to_mesh(mesh)
+            indices = np.asarray(indices, dtype=np.uint32)
+            uvs = np.asarray(uvs, dtype=np.float32)
+
+            # The mesh is triangulated, so its loops follow the xatlas triangles one to one
+            uv_flat = uvs[indices.reshape(-1)].reshape(-1)
+            mesh.uv_layers.active.data.foreach_set("uv", uv_flat)
             mesh.update()
-            bm.free()
+
+        if cache_keys:
+            _prune_cache()
 
         context.window_manager.progress_end()
         total_processed = total_meshes - cnt_fail
@@ -246,10 +647,6 @@ classes = (MESH_OT_unwrap_xatlas, VIEW3D_PT_unwrap_xatlas)
 
 
 def register():
-    if ENV_IS_BLENDER:
-        sys.path.append(EXTERNAL_FOLDER)
-        import xatlas
-
     from bpy.utils import register_class
 
     for cls in classes:
@@ -262,6 +659,8 @@ def unregister():
     for cls in reversed(classes):
         unregister_class(cls)
 
+    _close_pool()
+
     if ENV_IS_BLENDER:
         return
 
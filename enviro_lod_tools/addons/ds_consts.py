@@ -1,4 +1,5 @@
 import os.path
+from types import MappingProxyType
 
 CLEANUP_IDNAME = "mesh.clean_mesh_operator"
 CLEANUP_LABEL = "Clean selection"
@@ -36,7 +37,7 @@ EXTERNAL_FOLDER = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(_
 XATLAS_MODULE_NAME = "xatlas"
 PYFQMR_MODULE_NAME = "pyfqmr"
 
-ASCII_ART = {
+_ASCII_ART = {
 "CLEANUP":
 """
   _____ _                  _             
@@ -87,3 +88,7 @@ ASCII_ART = {
                           |___/ 
 """
 }
+
+# Read-only views of the banners, as text and pre-encoded to be written to a binary stdout
+ASCII_ART = MappingProxyType(_ASCII_ART)
+ASCII_ART_BYTES = MappingProxyType({key: (art + "\n").encode() for key, art in _ASCII_ART.items()})
@@ -3,34 +3,208 @@ import os
 import subprocess
 import math
 import importlib.util
-from functools import wraps
+from contextlib import contextmanager
+from functools import wraps, lru_cache
+from itertools import chain
 
+import numpy as np
 import bpy
 import bmesh
 
-from .ds_consts import EXTERNAL_FOLDER
+from .ds_consts import EXTERNAL_FOLDER, ASCII_ART, ASCII_ART_BYTES
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pyfqmr
+except ImportError:
+    # pyfqmr may be provided by the external folder, which is only added to sys.path once the operators register
+    pyfqmr = None
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    csr_matrix = connected_components = None
 
 # region Math
 
-def cubic_ease_out(t):
+def _find_root(parent, x):
+    """
+    Finds the root of an element in a union-find forest, halving the path on the way.
+    """
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def _union_pairs(parent, pairs):
+    """
+    Unites the elements of all pairs in a union-find forest.
     """
-    Cubic easing out function.
+    for i in range(len(pairs)):
+        root_a = _find_root(parent, pairs[i][0])
+        root_b = _find_root(parent, pairs[i][1])
+        if root_a != root_b:
+            parent[root_b] = root_a
 
-    :param t: Normalized time (between 0 and 1).
-    :type t: float
-    :return: Eased value.
-    :rtype: float
+
+def _flatten_roots(parent):
+    """
+    Points every element of a union-find forest directly at its root.
     """
-    return 1 - (1 - t) ** 3
+    for x in range(len(parent)):
+        parent[x] = _find_root(parent, x)
+
+
+# The union-find helpers are shared by the interpreted and the compiled paths. Compiling them also lets the compiled
+# kernels below call them.
+if njit is not None:
+    _find_root = njit(cache=True)(_find_root)
+    _union_pairs = njit(cache=True)(_union_pairs)
+    _flatten_roots = njit(cache=True)(_flatten_roots)
+
+
+def union_find_labels(pairs, count):
+    """
+    Labels the connected components of a graph, using union-find with path halving.
+    Runs compiled if Numba is installed.
+
+    :param pairs: The connections of the graph as (N, 2) array of element indices.
+    :type pairs: np.ndarray
+    :param count: The number of elements in the graph.
+    :type count: int
+    :return: The root element of the component of each element.
+    :rtype: np.ndarray
+    """
+    if njit is None:
+        # Plain lists are much faster to index than arrays in interpreted Python
+        parent, pairs = list(range(count)), pairs.tolist()
+    else:
+        parent = np.arange(count)
+
+    _union_pairs(parent, pairs)
+    _flatten_roots(parent)
+
+    return np.asarray(parent, dtype=np.int64)
+
+
+def component_labels(pairs, count):
+    """
+    Labels the connected components of a graph.
+    Uses the compiled traversal of SciPy if it is installed, and falls back to :func:`union_find_labels`.
+
+    :param pairs: The connections of the graph as (N, 2) array of element indices.
+    :type pairs: np.ndarray
+    :param count: The number of elements in the graph.
+    :type count: int
+    :return: The component label of each element. Two elements share a label exactly if they are connected.
+    :rtype: np.ndarray
+    """
+    if connected_components is None:
+        return union_find_labels(pairs, count)
+
+    graph = csr_matrix((np.ones(len(pairs), dtype=np.int32), (pairs[:, 0], pairs[:, 1])), shape=(count, count))
+    _, labels = connected_components(graph, directed=False)
+
+    return labels
+
+
+def _outer_boundary_loop_kernel(edge_verts, coords):
+    """
+    Plain loop implementation of :func:`outer_boundary_loop`, compiled with Numba if it is available.
+    """
+    edge_count = edge_verts.shape[0]
+    parent = np.arange(coords.shape[0])
+
+    # Union the vertices of all edges
+    _union_pairs(parent, edge_verts)
+
+    # Number the loops and sum up their perimeters
+    loop_of_root = np.full(coords.shape[0], -1, dtype=np.int64)
+    loop_ids = np.empty(edge_count, dtype=np.int64)
+    perimeters = np.zeros(edge_count, dtype=np.float64)
+    loop_count = 0
+
+    for i in range(edge_count):
+        v0, v1 = edge_verts[i, 0], edge_verts[i, 1]
+
+        root = _find_root(parent, v0)
+        if loop_of_root[root] < 0:
+            loop_of_root[root] = loop_count
+            loop_count += 1
+        loop_ids[i] = loop_of_root[root]
+
+        dx = coords[v0, 0] - coords[v1, 0]
+        dy = coords[v0, 1] - coords[v1, 1]
+        dz = coords[v0, 2] - coords[v1, 2]
+        perimeters[loop_ids[i]] += math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    return loop_ids, np.argmax(perimeters[:loop_count])
+
+
+_outer_boundary_loop_jit = njit(cache=True)(_outer_boundary_loop_kernel) if njit is not None else None
+
+
+def outer_boundary_loop(edge_verts, coords):
+    """
+    Groups boundary edges into connected loops and finds the loop with the largest perimeter.
+    Labels the loops with SciPy if it is installed, otherwise runs as a single compiled kernel if Numba is installed,
+    and falls back to union-find and NumPy.
+
+    :param edge_verts: The vertex indices of the boundary edges as (E, 2) array.
+    :type edge_verts: np.ndarray
+    :param coords: The coordinates of all vertices as (V, 3) array.
+    :type coords: np.ndarray
+    :return: The loop id of each edge and the id of the loop with the largest perimeter.
+    :rtype: tuple[np.ndarray, int]
+    """
+    if connected_components is None and _outer_boundary_loop_jit is not None:
+        loop_ids, outer_loop_id = _outer_boundary_loop_jit(edge_verts, coords)
+        return loop_ids, int(outer_loop_id)
+
+    # Connected boundary vertices share a label
+    vert_labels = component_labels(edge_verts, len(coords))
+    _, loop_ids = np.unique(vert_labels[edge_verts[:, 0]], return_inverse=True)
+
+    # Sums of squared lengths don't order the loops like their perimeters do, so the square root is still needed
+    edge_vectors = coords[edge_verts[:, 0]] - coords[edge_verts[:, 1]]
+    edge_lengths = np.sqrt(np.einsum("ij,ij->i", edge_vectors, edge_vectors))
+    loop_perimeters = np.bincount(loop_ids, weights=edge_lengths)
+
+    return loop_ids, int(np.argmax(loop_perimeters))
 
 # endregion
 
 # region Package Management
 
+# Base of all pip calls. Skips pip's version check (a network round trip) and never waits for input.
+_PIP_BASE = (sys.executable, "-m", "pip", "--disable-pip-version-check", "--no-input")
+
 
+def _pip_command(*args, verbose=False):
+    """
+    Build a pip command line from the shared base.
+
+    :param args: The pip subcommand and its arguments.
+    :type args: str
+    :param verbose: Whether pip should print its full output, defaults to False.
+    :type verbose: bool, optional
+    :return: The command line to execute.
+    :rtype: list[str]
+    """
+    return [*_PIP_BASE, *args] if verbose else [*_PIP_BASE, *args, "--quiet"]
+
+
+@lru_cache(maxsize=256)
 def is_package_installed(package_name):
     """
     Check if a package is installed.
+    The result is cached to avoid repeated scans of ``sys.path``. The (un)install functions clear the cache.
 
     :param package_name: The name of the package to check.
     :type package_name: str
@@ -41,23 +215,47 @@ def is_package_installed(package_name):
     return package_spec is not None
 
 
-def install_package(package_name):
+def install_package(package_name, verbose=False):
     """
     Install a package.
 
     :param package_name: The name of the package to install.
     :type package_name: str
+    :param verbose: Whether pip should print its full output, defaults to False.
+    :type verbose: bool, optional
     :return: None
     """
-    python_executable = sys.executable
     try:
         # Execute the pip command to install the package
-        subprocess.check_call([python_executable, "-m", "pip", "install", package_name])
+        subprocess.check_call(_pip_command("install", package_name, verbose=verbose))
         print(f"Successfully installed {package_name}")
+        is_package_installed.cache_clear()
     except subprocess.CalledProcessError as e:
         print(f"Failed to install {package_name}: {e}")
 
 
+def install_packages(package_names, verbose=False):
+    """
+    Install all given packages, which are not installed yet, with a single pip call.
+
+    :param package_names: The names of the packages to install.
+    :type package_names: Iterable[str]
+    :param verbose: Whether pip should print its full output, defaults to False.
+    :type verbose: bool, optional
+    :return: None
+    """
+    missing_packages = [name for name in package_names if not is_package_installed(name)]
+    if not missing_packages:
+        return
+
+    try:
+        subprocess.check_call(_pip_command("install", *missing_packages, verbose=verbose))
+        print(f"Successfully installed {', '.join(missing_packages)}")
+        is_package_installed.cache_clear()
+    except subprocess.CalledProcessError as e:
+        print(f"Failed to install {', '.join(missing_packages)}: {e}")
+
+
 def ensure_package_installed(package_name):
     """
     Check if a package is installed, and if not, install it.
@@ -87,8 +285,9 @@ def uninstall_package(package_name):
     """
     if package_name in sys.modules:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "uninstall", "-y", package_name])
+            subprocess.check_call(_pip_command("uninstall", "-y", package_name))
             print(f"Successfully uninstalled {package_name}")
+            is_package_installed.cache_clear()
         except subprocess.CalledProcessError as e:
             print(f"Failed to uninstall {package_name}: {e}")
 
@@ -103,12 +302,12 @@ def install_local_package(package_name):
     """
     src_path = os.path.join(EXTERNAL_FOLDER, package_name)
 
-    python_executable = sys.executable
     try:
         # Check if the path exists
         if os.path.exists(src_path):
-            subprocess.check_call([python_executable, "-m", "pip", "install", src_path])
+            subprocess.check_call(_pip_command("install", src_path))
             print(f"Successfully installed {package_name} from local source")
+            is_package_installed.cache_clear()
         else:
             print(f"Source path {src_path} does not exist")
     except subprocess.CalledProcessError as e:
@@ -116,8 +315,44 @@ def install_local_package(package_name):
 
 # endregion
 
+# region Logging
+
+def print_ascii_art(name):
+    """
+    Prints one of the ASCII art banners, by writing its pre-encoded bytes to the binary stdout.
+    Falls back to print, if stdout has been replaced by a text-only stream.
+
+    :param name: The key of the banner in ASCII_ART.
+    :type name: str
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+
+    if buffer is None:
+        print(ASCII_ART[name])
+        return
+
+    sys.stdout.flush()
+    buffer.write(ASCII_ART_BYTES[name])
+    buffer.flush()
+
+# endregion
+
 # region Blender Utility Functions
 
+@lru_cache(maxsize=None)
+def resolve_operator(op_str):
+    """
+    Resolves an operator by name. The result is cached, so the cache has to be cleared whenever the registered
+    operators change (see the package's register()).
+    :param op_str: The name of the operator.
+    :type op_str: str
+    :return: The operator.
+    :rtype: bpy.ops._BPyOpsSubModOp
+    """
+    category, operator_name = op_str.split(".")
+    return getattr(getattr(bpy.ops, category), operator_name)
+
+
 def launch_operator_by_name(op_str):
     """
     Launches an operator by name.
@@ -126,84 +361,153 @@ def launch_operator_by_name(op_str):
     :return: None
     """
     try:
-        category, operator_name = op_str.split(".")
-        f = getattr(getattr(bpy.ops, category), operator_name)
-        f()
+        resolve_operator(op_str)()
     except AttributeError:
         print(f"Error: Operator {op_str} does not exist.")
     except RuntimeError as e:
         print(f"Runtime Error: {e}")
 
 
-def vertex_group_from_outer_boundary(obj):
+# Suffix of the vertex group holding all vertices, which are not in the preserved vertex group of the same name
+INTERIOR_VG_SUFFIX = "_Interior"
+
+
+def boundary_edge_vertices(mesh):
+    """
+    Finds the boundary edges (edges with only one linked face) of a mesh.
+
+    :param mesh: The mesh to process.
+    :type mesh: bpy.types.Mesh
+    :return: The vertex indices of the boundary edges as (E, 2) array.
+    :rtype: np.ndarray
+    """
+    # Boundary edges are used by exactly one face corner
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    edge_use_counts = np.bincount(loop_edges, minlength=len(mesh.edges))
+
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    return edge_verts.reshape(-1, 2)[edge_use_counts == 1]
+
+
+def _preserve_edges_vertex_group(obj, vertex_indices):
+    """
+    Creates the vertex group, which protects the given vertices during decimation.
+
+    :param obj: The object to process.
+    :type obj: bpy.types.Object
+    :param vertex_indices: The indices of the vertices to add, may contain duplicates and have any shape.
+    :type vertex_indices: np.ndarray
+    :returns: Name of the vertex group.
+    :rtype: str
+    """
+    mesh = obj.data
+
+    # Blender inserts the weights in order, so sorted unique indices let it append instead of searching
+    preserved = np.unique(vertex_indices)
+    vg = obj.vertex_groups.new(name="PreserveEdges")
+    vg.add(preserved.tolist(), 1.0, "ADD")
+
+    # Store the complement as well, so the decimate modifier doesn't have to invert the group
+    interior_vg = obj.vertex_groups.new(name=f"{vg.name}{INTERIOR_VG_SUFFIX}")
+    interior_vg.add(np.setdiff1d(np.arange(len(mesh.vertices)), preserved, assume_unique=True).tolist(), 1.0, "ADD")
+
+    return vg.name
+
+
+def vg_from_nonmanifold(obj, boundary_edge_verts=None):
+    """
+    Creates a vertex group from all boundary (non-manifold) vertices to ensure they are preserved during decimation.
+
+    :param obj: The object to process.
+    :type obj: bpy.types.Object
+    :param boundary_edge_verts: The boundary edges of the mesh, if already known.
+    :type boundary_edge_verts: np.ndarray or None
+    :returns: Name of the vertex group.
+    :rtype: str
+    """
+    if boundary_edge_verts is None:
+        boundary_edge_verts = boundary_edge_vertices(obj.data)
+
+    return _preserve_edges_vertex_group(obj, boundary_edge_verts)
+
+
+def vg_from_outer_loop(obj, boundary_edge_verts=None):
     """
     Creates a vertex group from the outer boundary to ensure it is preserved during decimation.
     This function selects only the outer boundary, excluding any holes or inner boundaries.
+
     :param obj: The object to process.
     :type obj: bpy.types.Object
+    :param boundary_edge_verts: The boundary edges of the mesh, if already known.
+    :type boundary_edge_verts: np.ndarray or None
     :returns: Name of the vertex group.
     :rtype: str
     """
-    # Ensure the object is active
-    bpy.context.view_layer.objects.active = obj
+    mesh = obj.data
 
-    # Switch to EDIT mode and create a BMesh representation
-    bpy.ops.object.mode_set(mode="EDIT")
-    bm = bmesh.from_edit_mesh(obj.data)
-    bm.edges.ensure_lookup_table()
+    if boundary_edge_verts is None:
+        boundary_edge_verts = boundary_edge_vertices(mesh)
 
-    # Deselect all edges
-    for edge in bm.edges:
-        edge.select = False
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
 
-    # Select boundary edges (edges with only one linked face)
-    boundary_edges = [edge for edge in bm.edges if len(edge.link_faces) == 1]
-    for edge in boundary_edges:
-        edge.select = True
+    # Build edge loops from the boundary edges and identify the one with the largest perimeter (outer boundary)
+    edge_loop_ids, outer_loop_id = outer_boundary_loop(boundary_edge_verts, coords)
+    outer_loop_edge_verts = boundary_edge_verts[edge_loop_ids == outer_loop_id]
 
-    # Build edge loops from the boundary edges
-    unvisited_edges = set(boundary_edges)
-    edge_loops = []
+    # Collect vertices from the outer loop
+    return _preserve_edges_vertex_group(obj, outer_loop_edge_verts)
 
-    while unvisited_edges:
-        current_loop = set()
-        edges_to_visit = {unvisited_edges.pop()}
 
-        while edges_to_visit:
-            edge = edges_to_visit.pop()
-            current_loop.add(edge)
-            for vert in edge.verts:
-                connected_edges = set(e for e in vert.link_edges if e in unvisited_edges)
-                edges_to_visit.update(connected_edges)
-                unvisited_edges.difference_update(connected_edges)
+def vertex_group_from_outer_boundary(obj):
+    """
+    Creates a vertex group from the outer boundary to ensure it is preserved during decimation.
+    The boundary loops are labelled in a single pass by :func:`vg_from_outer_loop`. A boundary made of one loop is
+    its own outer boundary, so no separate component count is needed.
 
-        edge_loops.append(current_loop)
+    :param obj: The object to process.
+    :type obj: bpy.types.Object
+    :returns: Name of the vertex group.
+    :rtype: str
+    """
+    boundary_edge_verts = boundary_edge_vertices(obj.data)
 
-    # Calculate the perimeter of each edge loop
-    loop_perimeters = []
-    for loop in edge_loops:
-        perimeter = sum(edge.calc_length() for edge in loop)
-        loop_perimeters.append(perimeter)
+    # A closed mesh has no loops to compare, the vertex group is simply left empty
+    if not len(boundary_edge_verts):
+        return vg_from_nonmanifold(obj, boundary_edge_verts)
 
-    # Identify the edge loop with the largest perimeter (outer boundary)
-    max_perimeter_index = loop_perimeters.index(max(loop_perimeters))
-    outer_loop_edges = edge_loops[max_perimeter_index]
+    return vg_from_outer_loop(obj, boundary_edge_verts)
 
-    # Collect vertices from the outer loop
-    outer_loop_vertices = {vert.index for edge in outer_loop_edges for vert in edge.verts}
 
-    # Create a vertex group and add the outer loop vertices
-    bpy.ops.object.mode_set(mode="OBJECT")
-    vg = obj.vertex_groups.new(name="PreserveEdges")
-    vg.add(list(outer_loop_vertices), 1.0, "ADD")
+def set_mesh_triangles(mesh, coords, triangles):
+    """
+    Replaces the geometry of a mesh with the given triangles, writing the buffers in bulk with foreach_set.
+
+    :param mesh: The mesh to rebuild.
+    :type mesh: bpy.types.Mesh
+    :param coords: The vertex coordinates as (V, 3) array.
+    :type coords: np.ndarray
+    :param triangles: The vertex indices of each triangle as (T, 3) array.
+    :type triangles: np.ndarray
+    :return: None
+    """
+    corner_verts = np.ascontiguousarray(triangles, dtype=np.int32).ravel()
 
-    # Deselect everything and update the mesh
-    bpy.ops.object.mode_set(mode="EDIT")
-    bmesh.update_edit_mesh(obj.data)
-    bpy.ops.mesh.select_all(action="DESELECT")
-    bpy.ops.object.mode_set(mode="OBJECT")
+    mesh.clear_geometry()
 
-    return vg.name
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+
+    mesh.loops.add(len(corner_verts))
+    mesh.loops.foreach_set("vertex_index", corner_verts)
+
+    mesh.polygons.add(len(corner_verts) // 3)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(corner_verts), 3, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
 
 
 def clear_scene():
@@ -215,35 +519,12 @@ def clear_scene():
     if bpy.context.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
 
-    # Select all objects and delete
-    bpy.ops.object.select_all(action="SELECT")
-    bpy.ops.object.delete()
-
-    # Remove all meshes, lights, cameras and other data blocks still in memory and unused
-    for block in bpy.data.meshes:
-        bpy.data.meshes.remove(block)
-    for block in bpy.data.cameras:
-        bpy.data.cameras.remove(block)
-    for block in bpy.data.lights:
-        bpy.data.lights.remove(block)
-    for block in bpy.data.materials:
-        bpy.data.materials.remove(block)
-    for block in bpy.data.textures:
-        bpy.data.textures.remove(block)
-    for block in bpy.data.curves:
-        bpy.data.curves.remove(block)
-    for block in bpy.data.metaballs:
-        bpy.data.metaballs.remove(block)
-    for block in bpy.data.armatures:
-        bpy.data.armatures.remove(block)
-    for block in bpy.data.particles:
-        bpy.data.particles.remove(block)
-    for block in bpy.data.grease_pencils:
-        bpy.data.grease_pencils.remove(block)
-    for block in bpy.data.images:
-        bpy.data.images.remove(block)
-    for block in bpy.data.fonts:
-        bpy.data.fonts.remove(block)
+    # Remove all objects together with their meshes, lights, cameras and other data blocks in a single pass,
+    # without going through the selection and the delete operator
+    bpy.data.batch_remove(ids=list(chain(bpy.data.objects, bpy.data.meshes, bpy.data.cameras, bpy.data.lights,
+                                         bpy.data.materials, bpy.data.textures, bpy.data.curves, bpy.data.metaballs,
+                                         bpy.data.armatures, bpy.data.particles, bpy.data.grease_pencils,
+                                         bpy.data.images, bpy.data.fonts)))
 
 
 def set_cpu_rendering():
@@ -251,6 +532,8 @@ def set_cpu_rendering():
     Sets the CPU as the rendering device for Cycles.
     :return: None
     """
+    global _gpu_configured
+
     # Set the render engine to Cycles if it's not already set
     bpy.context.scene.render.engine = "CYCLES"
 
@@ -261,6 +544,9 @@ def set_cpu_rendering():
     if cycles_prefs.compute_device_type != "NONE":
         print(f"Changing compute device type to NONE (CPU).")
         cycles_prefs.compute_device_type = "NONE"
+
+        # The GPU setup was undone, so the next GPU request has to configure the devices again
+        _gpu_configured = False
     else:
         print("Compute Device is already set to NONE (CPU).")
 
@@ -269,23 +555,39 @@ def set_cpu_rendering():
     print("CPU rendering is set.")
 
 
+_devices_refreshed = False
+_gpu_configured = False
+
+
 def set_gpu_rendering():
     """
     Sets the GPU rendering engine to Cycles.
     :return: None
     """
+    global _devices_refreshed, _gpu_configured
+
     # Set the render engine to Cycles if it's not already set
     bpy.context.scene.render.engine = "CYCLES"
 
+    # The devices were already configured in this session, only the scene needs to be pointed at them
+    if _gpu_configured:
+        bpy.context.scene.cycles.device = "GPU"
+        return
+
     # Get Cycles preferences
     cycles_prefs = bpy.context.preferences.addons["cycles"].preferences
 
     if cycles_prefs.compute_device_type != "NONE":
         print("Compute Device is already set.")
+        bpy.context.scene.cycles.device = "GPU"
+        _gpu_configured = True
         return
 
-    # Refresh devices, as they are never initialized when using bpy as a module only
-    cycles_prefs.refresh_devices()
+    # Refresh devices, as they are never initialized when using bpy as a module only.
+    # The device enumeration queries the drivers, so it is only done once per session.
+    if not _devices_refreshed:
+        cycles_prefs.refresh_devices()
+        _devices_refreshed = True
 
     # Initialize a variable to track if a suitable GPU has been found
     gpu_found = False
@@ -315,6 +617,7 @@ def set_gpu_rendering():
     # If a GPU was successfully found and set
     if gpu_found:
         bpy.context.scene.cycles.device = "GPU"
+        _gpu_configured = True
         print("GPU rendering is set.")
     else:
         print("No compatible GPU found. Check your system configuration or Blender version.")
@@ -352,11 +655,19 @@ def bmesh_wrapper(func):
         bm = kwargs.pop("bm", None)
         return_bm = kwargs.pop("return_bm", False)
 
-        if bm is None:
+        owns_bm = bm is None
+        if owns_bm:
             bm = bmesh.new()
             bm.from_mesh(mesh)
 
-        result = func(*args, bm=bm, **kwargs)
+        try:
+            result = func(*args, bm=bm, **kwargs)
+        except BaseException:
+            # Release a BMesh we created ourselves, so a failing operation doesn't keep it alive.
+            # A BMesh passed in by the caller stays valid, as the caller may still resolve it (e.g. on ImportError).
+            if owns_bm:
+                bm.free()
+            raise
 
         if not return_bm:
             mesh_data = resolve_bmesh(mesh_data, bm=bm)
@@ -396,40 +707,84 @@ def resolve_bmesh(mesh_data, bm=None):
     return mesh_data
 
 
-@bmesh_wrapper
-def delete_loose_geometry(mesh_data, bm=None, remove_faces=True):
+@contextmanager
+def bmesh_session(mesh_data, bm=None):
     """
-    Remove loose (disconnected) vertices, edges, and optionally faces from the object.
+    Keeps a single BMesh open for a sequence of BMesh operations, which is written back to the mesh once on exit.
+    Pass the yielded BMesh to the decorated operations as `bm` together with `return_bm=True`.
+    If the block raises, the BMesh is freed without writing it back.
 
-    :param mesh_data: The object whose loose geometry will be removed.
+    :param mesh_data: The object whose mesh is processed.
     :type mesh_data: bpy.types.Object
-    :param bm: The BMesh object to operate on. If None, it will be created from the mesh data.
+    :param bm: An already open BMesh of the object to continue with. If None, it will be created from the mesh data.
+    :type bm: bmesh.types.BMesh, optional
+    :return: The BMesh to operate on.
+    :rtype: bmesh.types.BMesh
+    """
+    if bm is None:
+        bm = bmesh.new()
+        bm.from_mesh(mesh_data.data)
+
+    try:
+        yield bm
+    except BaseException:
+        bm.free()
+        raise
+
+    resolve_bmesh(mesh_data, bm=bm)
+
+
+def _delete_loose_geometry_bm(bm, mesh_name, remove_faces=True):
+    """
+    Undecorated implementation of :func:`delete_loose_geometry`, for callers which already hold a BMesh.
+
+    :param bm: The BMesh to operate on.
     :type bm: bmesh.types.BMesh
+    :param mesh_name: The name of the mesh, for the report.
+    :type mesh_name: str
     :param remove_faces: If True, also removes loose faces. Default is True.
     :type remove_faces: bool
-    :return: A resolved bpy Object if return_bm is `False`, otherwise the BMesh data for further processing.
-    :rtype: bpy.types.Object or bmesh.types.BMesh
+    :return: The BMesh data for further processing.
+    :rtype: bmesh.types.BMesh
     """
-    # Remove loose vertices (vertices not connected to any edge)
+    # Collect loose vertices (vertices not connected to any edge)
     loose_verts = [v for v in bm.verts if not v.link_edges]
-    bmesh.ops.delete(bm, geom=loose_verts, context="VERTS")
 
-    # Remove loose edges (edges not connected to any face)
+    # Collect loose edges (edges not connected to any face)
     loose_edges = [e for e in bm.edges if not e.link_faces]
-    bmesh.ops.delete(bm, geom=loose_edges, context="EDGES")
 
     loose_faces = []
 
-    # Optionally remove loose faces (faces not connected to other faces via edges)
+    # Optionally collect loose faces (faces not connected to other faces via edges)
     if remove_faces:
         loose_faces = [f for f in bm.faces if not f.edges]
-        bmesh.ops.delete(bm, geom=loose_faces, context="FACES")
 
-    print(f"Removed {len(loose_verts)} loose vertices, {len(loose_edges)} loose edges, and {len(loose_faces)} loose faces on {mesh_data.name}.")
+    # Remove everything in a single pass. The edge context deletes the given edges and faces, the given vertices
+    # as well as the vertices left unused by the deleted edges, the same as the separate deletions did.
+    bmesh.ops.delete(bm, geom=loose_verts + loose_edges + loose_faces, context="EDGES")
+
+    print(f"Removed {len(loose_verts)} loose vertices, {len(loose_edges)} loose edges, and {len(loose_faces)} loose faces on {mesh_name}.")
 
     return bm
 
 
+@bmesh_wrapper
+def delete_loose_geometry(mesh_data, bm=None, remove_faces=True):
+    """
+    Remove loose (disconnected) vertices, edges, and optionally faces from the object.
+
+    :param mesh_data: The object whose loose geometry will be removed.
+    :type mesh_data: bpy.types.Object
+    :param bm: The BMesh object to operate on. If None, it will be created from the mesh data.
+    :type bm: bmesh.types.BMesh
+    :param remove_faces: If True, also removes loose faces. Default is True.
+    :type remove_faces: bool
+    :return: A resolved bpy Object if return_bm is `False`, otherwise the BMesh data for further processing.
+    :rtype: bpy.types.Object or bmesh.types.BMesh
+    """
+    return _delete_loose_geometry_bm(bm, mesh_data.name, remove_faces=remove_faces)
+
+
 @bmesh_wrapper
 def merge_meshes(mesh_data, additional_objs, bm=None):
     """
@@ -444,21 +799,18 @@ def merge_meshes(mesh_data, additional_objs, bm=None):
     :return: A resolved bpy Object if return_bm is `False`, otherwise the BMesh data for further processing.
     :rtype: bpy.types.Object or bmesh.types.BMesh
     """
+    world_to_base = mesh_data.matrix_world.inverted()
+
     # Loop through additional objects and merge their meshes
     for additional_obj in additional_objs:
-        # Create a new BMesh for the additional mesh
-        temp_bm = bmesh.new()
-        temp_bm.from_mesh(additional_obj.data)
-
-        # Transform the additional mesh into the base object's local space
-        matrix = additional_obj.matrix_world @ mesh_data.matrix_world.inverted()
-        bmesh.ops.transform(temp_bm, matrix=matrix, verts=temp_bm.verts)
-
-        # Merge the temporary BMesh into the base BMesh
+        # Append the additional mesh to the base BMesh, its vertices land at the end
+        new_verts_start = len(bm.verts)
         bm.from_mesh(additional_obj.data)
+        bm.verts.ensure_lookup_table()
 
-        # Free the temporary BMesh
-        temp_bm.free()
+        # Transform only the appended vertices into the base object's local space
+        matrix = world_to_base @ additional_obj.matrix_world
+        bmesh.ops.transform(bm, matrix=matrix, verts=bm.verts[new_verts_start:])
 
         # Remove the additional object's mesh data and object itself
         bpy.data.meshes.remove(additional_obj.data)
@@ -480,34 +832,25 @@ def keep_largest_component(mesh_data, bm=None):
     :return: A resolved bpy Object if return_bm is `False`, otherwise the BMesh data for further processing.
     :rtype: bpy.types.Object or bmesh.types.BMesh
     """
-    # Find connected components
-    verts = set(bm.verts)
-    processed_verts = 0
-    components = []
-
-    while verts:
-        v = verts.pop()
-        stack = [v]
-        component = {v}
-        processed_verts += 1
+    if not bm.verts:
+        return bm
 
-        while stack:
-            current = stack.pop()
-            for edge in current.link_edges:
-                linked_vert = edge.other_vert(current)
-                if linked_vert in verts:
-                    verts.remove(linked_vert)
-                    stack.append(linked_vert)
-                    component.add(linked_vert)
-                    processed_verts += 1
+    # Flush the BMesh to a temporary mesh, so the edges can be copied out in bulk
+    temp_mesh = bpy.data.meshes.new(f"{mesh_data.name}_components")
+    bm.to_mesh(temp_mesh)
 
-        components.append(component)
+    edge_verts = np.empty(len(temp_mesh.edges) * 2, dtype=np.int32)
+    temp_mesh.edges.foreach_get("vertices", edge_verts)
+    bpy.data.meshes.remove(temp_mesh)
 
-    # Find the largest component
-    largest_component = max(components, key=len)
+    # Find connected components and the largest one
+    vert_labels = component_labels(edge_verts.reshape(-1, 2), len(bm.verts))
+    labels, component_sizes = np.unique(vert_labels, return_counts=True)
+    largest_label = labels[np.argmax(component_sizes)]
 
     # Delete other components
-    verts_to_delete = [v for component in components if component != largest_component for v in component]
+    bm.verts.ensure_lookup_table()
+    verts_to_delete = [bm.verts[i] for i in np.flatnonzero(vert_labels != largest_label).tolist()]
     print(f"Deleting {len(verts_to_delete)} vertices.")
     bmesh.ops.delete(bm, geom=verts_to_delete, context="VERTS")
 
@@ -554,45 +897,31 @@ def clean_mesh_geometry(mesh_data, merge_threshold, bm=None):
             print("No holes detected.")
             return
 
-        # Find boundary edge loops (holes)
-        loops = []
-        visited_edges = set()
-
-        for edge in boundary_edges:
-            if edge in visited_edges:
-                continue
-
-            loop = []
-            stack = [edge]
-            while stack:
-                current_edge = stack.pop()
-                if current_edge in visited_edges:
-                    continue
-                visited_edges.add(current_edge)
-                loop.append(current_edge)
-
-                for vert in current_edge.verts:
-                    for linked_edge in vert.link_edges:
-                        if linked_edge in boundary_edges and linked_edge not in visited_edges:
-                            stack.append(linked_edge)
-            loops.append(loop)
+        bm.verts.index_update()
+        edge_verts = np.array([(edge.verts[0].index, edge.verts[1].index) for edge in boundary_edges], dtype=np.int64)
+
+        # Find boundary edge loops (holes) as the connected components of their vertices
+        vert_labels = component_labels(edge_verts, len(bm.verts))
+        _, edge_loops, loop_sizes = np.unique(vert_labels[edge_verts[:, 0]], return_inverse=True, return_counts=True)
 
         # Exclude the largest loop (assumed to be the outer boundary)
-        loops.sort(key=lambda l: len(l), reverse=True)
-        loops.pop(0)
+        outer_loop = np.argmax(loop_sizes)
 
-        num_holes = len(loops)
-        holes = [edge for loop in loops for edge in loop]
+        num_holes = len(loop_sizes) - 1
+        holes = [boundary_edges[i] for i in np.flatnonzero(edge_loops != outer_loop).tolist()]
 
-        # Fill holes
-        result = bmesh.ops.edgenet_fill(bm, edges=holes)
+        # Fill holes, each remaining boundary loop with a face. Only the hole edges are passed, so no sides cap is needed
+        result = bmesh.ops.holes_fill(bm, edges=holes, sides=0)
         num_faces_created = len(result.get('faces', []))
 
         print(f"Filled {num_holes} holes, created {num_faces_created} new faces.")
 
     bmesh.ops.triangulate(bm, faces=bm.faces, quad_method="BEAUTY", ngon_method="BEAUTY")
 
-    hole_edges = [e for e in bm.edges if len(e.link_faces) == 1]
+    # Count the faces of every edge in one pass, edges with a single face are on a boundary
+    bm.edges.ensure_lookup_table()
+    edge_face_counts = np.fromiter((len(e.link_faces) for e in bm.edges), dtype=np.int32, count=len(bm.edges))
+    hole_edges = [bm.edges[i] for i in np.flatnonzero(edge_face_counts == 1).tolist()]
 
     # Fill holes
     fill_holes(hole_edges)
@@ -605,8 +934,8 @@ def clean_mesh_geometry(mesh_data, merge_threshold, bm=None):
 
     print("Mesh geometry cleaned.")
 
-    # Call delete_loose_geometry
-    bm = delete_loose_geometry(mesh_data, bm=bm, return_bm=True)
+    # Delete loose geometry on the same BMesh, without going through the wrapper again
+    bm = _delete_loose_geometry_bm(bm, mesh_data.name)
 
     return bm
 
@@ -617,7 +946,7 @@ def clean_mesh_geometry(mesh_data, merge_threshold, bm=None):
 
 @bmesh_wrapper
 def decimate_with_pyqmfr(mesh_data, target_face_count, bm=None, max_iterations=80,
-                         preserve_border=True, merge_threshold=0.0001):
+                         preserve_border=True, merge_threshold=0.0001, verbose=False):
     """
     Simplifies a Blender object's mesh using pyfqmr to reduce its complexity to a specified
     percentage. All operations are performed using a single bmesh object to minimize memory usage.
@@ -632,30 +961,44 @@ def decimate_with_pyqmfr(mesh_data, target_face_count, bm=None, max_iterations=8
     :type preserve_border: bool, optional
     :param merge_threshold: The threshold for merging vertices, defaults to 0.0001.
     :type merge_threshold: float, optional
+    :param verbose: Whether pyfqmr should print its progress on every iteration, defaults to False.
+    :type verbose: bool, optional
     :return: A resolved bpy Object if return_bm is `False`, otherwise the BMesh data for further processing.
     :rtype: bpy.types.Object or bmesh.types.BMesh
     """
-    import numpy as np
-    import pyfqmr
+    global pyfqmr
+    if pyfqmr is None:
+        import pyfqmr  # Raises ImportError if still unavailable, which lets callers fall back to the decimate modifier
 
     bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=merge_threshold)
 
     # Triangulate the mesh using bmesh
     bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method='BEAUTY', ngon_method='BEAUTY')
 
-    # Ensure the BMesh is up to date
-    bm.verts.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
+    starting_face_count = len(bm.faces)
+    target_face_count = max(target_face_count, 4)  # Ensure minimum face count
 
-    # Get vertices as a numpy array
-    vertices = np.array([v.co[:] for v in bm.verts], dtype=np.float64)
+    # Nothing to reduce, skip the round trip through the simplifier
+    if starting_face_count <= target_face_count:
+        print(f"Face count ({starting_face_count}) already at or below target ({target_face_count}), skipping.")
+        bm.normal_update()
+        return bm
 
-    # Get faces as a numpy array
-    faces = np.array([[v.index for v in f.verts] for f in bm.faces], dtype=np.int32)
+    # Flush the BMesh to a temporary mesh, so its buffers can be copied out in bulk
+    temp_mesh = bpy.data.meshes.new(f"{mesh_data.name}_pyfqmr")
+    bm.to_mesh(temp_mesh)
 
-    starting_face_count = len(faces)
+    vertices = np.empty(len(temp_mesh.vertices) * 3, dtype=np.float32)
+    temp_mesh.vertices.foreach_get("co", vertices)
+    vertices = vertices.reshape(-1, 3).astype(np.float64)
 
-    target_face_count = max(target_face_count, 4)  # Ensure minimum face count
+    # All faces are triangles, so the face corners are the triangles in order
+    faces = np.empty(len(temp_mesh.loops), dtype=np.int32)
+    temp_mesh.loops.foreach_get("vertex_index", faces)
+    faces = faces.reshape(-1, 3)
+
+    # Release the temporary mesh before simplifying, so it is not left behind if the simplifier fails
+    bpy.data.meshes.remove(temp_mesh)
 
     # Initialize the simplifier
     mesh_simplifier = pyfqmr.Simplify()
@@ -667,28 +1010,24 @@ def decimate_with_pyqmfr(mesh_data, target_face_count, bm=None, max_iterations=8
         aggressiveness=7,
         max_iterations=max_iterations,
         preserve_border=preserve_border,
-        verbose=10,
+        verbose=verbose,
     )
 
     # Retrieve the simplified mesh
     vertices_out, faces_out, normals_out = mesh_simplifier.getMesh()
 
-    # Clear the existing BMesh to reuse it
-    bm.clear()
+    # Skip degenerate and duplicate faces, which BMesh would reject
+    faces_out = faces_out[(faces_out[:, 0] != faces_out[:, 1]) &
+                          (faces_out[:, 1] != faces_out[:, 2]) &
+                          (faces_out[:, 2] != faces_out[:, 0])]
+    _, first_faces = np.unique(np.sort(faces_out, axis=1), axis=0, return_index=True)
+    faces_out = faces_out[np.sort(first_faces)]
 
-    # Add the simplified vertices to the BMesh
-    for co in vertices_out:
-        bm.verts.new(co)
-    bm.verts.ensure_lookup_table()
+    # Write the simplified buffers straight into the object's mesh and reload the BMesh from it
+    set_mesh_triangles(mesh_data.data, vertices_out, faces_out)
 
-    # Add the simplified faces to the BMesh
-    for face_indices in faces_out:
-        try:
-            bm.faces.new([bm.verts[i] for i in face_indices])
-        except ValueError:
-            # Face already exists; skip it
-            pass
-    bm.faces.ensure_lookup_table()
+    bm.clear()
+    bm.from_mesh(mesh_data.data)
 
     # Remove doubles (merge vertices)
     bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=merge_threshold)
@@ -700,7 +1039,6 @@ def decimate_with_pyqmfr(mesh_data, target_face_count, bm=None, max_iterations=8
     return bm
 
 
-# Unused
 @bmesh_wrapper
 def simplify_flat_areas(mesh_data, target_face_count=1000, curvature_threshold=0.05, bm=None, vertex_group_name=None):
     """
@@ -716,13 +1054,13 @@ def simplify_flat_areas(mesh_data, target_face_count=1000, curvature_threshold=0
     :type vertex_group_name: str or None
     :return: None
     """
-    # Get the vertex group that defines protected vertices, if any
-    protected_vertices = set()
-    if vertex_group_name and vertex_group_name in mesh_data.vertex_groups:
-        vg = mesh_data.vertex_groups[vertex_group_name]
-        protected_vertices.update(
-            v.index for v in mesh_data.data.vertices if vg.index in [g.group for g in v.groups]
-        )
+    # Get the vertex group that defines protected vertices, if any. The weights are read from the BMesh deform layer,
+    # as the BMesh passed in may already differ from the object's mesh.
+    protected = np.zeros(len(bm.verts), dtype=bool)
+    deform_layer = bm.verts.layers.deform.active
+    if vertex_group_name and vertex_group_name in mesh_data.vertex_groups and deform_layer is not None:
+        vg_index = mesh_data.vertex_groups[vertex_group_name].index
+        protected = np.fromiter((vg_index in v[deform_layer] for v in bm.verts), dtype=bool, count=len(bm.verts))
 
     # Triangulate the mesh to ensure all faces are triangles
     bmesh.ops.triangulate(bm, faces=bm.faces[:])
@@ -730,44 +1068,60 @@ def simplify_flat_areas(mesh_data, target_face_count=1000, curvature_threshold=0
     initial_face_count = len(bm.faces)
     if initial_face_count <= target_face_count:
         print(f"Current face count ({initial_face_count}) is already less than or equal to target face count ({target_face_count}).")
-        bm.free()
-        return
+        return bm
 
-    # Function to compute curvature at a vertex using the angle deficit method
-    def compute_vertex_curvature(vert):
-        angle_sum = sum((loop.calc_angle() or 0.0) for loop in vert.link_loops)
-        return abs(2 * math.pi - angle_sum)
+    # Flush the BMesh to a temporary mesh, so the geometry can be processed as flat arrays
+    temp_mesh = bpy.data.meshes.new(f"{mesh_data.name}_curvature")
+    bm.to_mesh(temp_mesh)
 
-    # Compute curvature for all vertices once and store in a dictionary
-    curvature_dict = {
-        vert: compute_vertex_curvature(vert)
-        for vert in bm.verts
-        if vert.is_valid and vert.index not in protected_vertices
-    }
+    coords = np.empty(len(temp_mesh.vertices) * 3, dtype=np.float32)
+    temp_mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+
+    # All faces are triangles, so the face corners are the triangles in order
+    triangles = np.empty(len(temp_mesh.loops), dtype=np.int32)
+    temp_mesh.loops.foreach_get("vertex_index", triangles)
+    triangles = triangles.reshape(-1, 3)
+
+    edge_verts = np.empty(len(temp_mesh.edges) * 2, dtype=np.int32)
+    temp_mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+
+    # Compute curvature for all vertices at once using the angle deficit method
+    to_prev = coords[np.roll(triangles, 1, axis=1)] - coords[triangles]
+    to_next = coords[np.roll(triangles, -1, axis=1)] - coords[triangles]
+    length_products = np.linalg.norm(to_prev, axis=2) * np.linalg.norm(to_next, axis=2)
+    cos_angles = np.einsum("ijk,ijk->ij", to_prev, to_next) / np.maximum(length_products, 1e-12)
+    corner_angles = np.where(length_products > 1e-12, np.arccos(np.clip(cos_angles, -1.0, 1.0)), 0.0)
+
+    angle_sums = np.bincount(triangles.ravel(), weights=corner_angles.ravel(), minlength=len(coords))
+    curvature = np.abs(2 * math.pi - angle_sums)
 
     # Early exit if no vertices meet the curvature criteria
-    if not any(curv < curvature_threshold for curv in curvature_dict.values()):
+    movable = (curvature < curvature_threshold) & ~protected
+    if not movable.any():
         print("No vertices with curvature below the threshold.")
-        bm.free()
-        return
-
-    # Adjust positions of low curvature vertices
-    for vert in curvature_dict:
-        if curvature_dict[vert] < curvature_threshold:
-            # Find neighboring vertices with higher curvature
-            high_curvature_neighbors = [
-                v for v in vert.link_edges
-                if v.other_vert(vert).is_valid
-                and curvature_dict.get(v.other_vert(vert), curvature_threshold) >= curvature_threshold
-                and v.other_vert(vert).index not in protected_vertices
-            ]
-            if high_curvature_neighbors:
-                # Move vertex to the position of the neighbor with the highest curvature
-                target_vert = max(
-                    (v.other_vert(vert) for v in high_curvature_neighbors),
-                    key=lambda v: curvature_dict.get(v, 0.0)
-                )
-                vert.co = target_vert.co
+        bpy.data.meshes.remove(temp_mesh)
+        return bm
+
+    # Pair the low curvature vertices with their neighbors of higher curvature, in both directions of every edge
+    eligible = (curvature >= curvature_threshold) & ~protected
+    sources = np.concatenate((edge_verts[:, 0], edge_verts[:, 1]))
+    targets = np.concatenate((edge_verts[:, 1], edge_verts[:, 0]))
+    valid_pairs = movable[sources] & eligible[targets]
+    sources, targets = sources[valid_pairs], targets[valid_pairs]
+
+    # Move each low curvature vertex to the position of its neighbor with the highest curvature
+    order = np.lexsort((curvature[targets], sources))
+    sources, targets = sources[order], targets[order]
+    last_of_source = np.ones(len(sources), dtype=bool)
+    last_of_source[:-1] = sources[1:] != sources[:-1]
+    coords[sources[last_of_source]] = coords[targets[last_of_source]]
+
+    temp_mesh.vertices.foreach_set("co", coords.ravel())
+    bm.clear()
+    bm.from_mesh(temp_mesh)
+    bpy.data.meshes.remove(temp_mesh)
 
     # Note: The methodology of moving the vertices to the highest curvature neighbor has been chosen
     # to merge them in bulk by calling the bmesh.ops.remove_doubles function. This is tremendously faster than
@@ -786,21 +1140,23 @@ def simplify_flat_areas(mesh_data, target_face_count=1000, curvature_threshold=0
     return bm
 
 
-def decimate_object(mesh_data, target_ratio, iterations=5, vg_name=None, merge_threshold = 0.0001):
+def decimate_object(mesh_data, target_ratio, vg_name=None, merge_threshold = 0.0001, min_reduction=0.005):
     """
-    Applies a decimate modifier iteratively to a Blender object to reduce its complexity by a specified
-    percentage after a given number of iterations.
+    Applies a single decimate modifier to a Blender object to reduce its face count to the given ratio.
+    The collapse decimation is iterative internally, so one modifier evaluation replaces a chain of smaller steps.
+    If the target is still not reached afterwards, the remaining faces are reduced in flat areas
+    (see :func:`simplify_flat_areas`).
 
     :param mesh_data: The Blender object to which the decimate modifier will be applied.
     :type mesh_data: bpy.types.Object
     :param target_ratio: The ratio at which the object should be reduced to.
     :type target_ratio: float
-    :param iterations: The number of times the decimate modifier should be applied, defaults to 5.
-    :type iterations: int, optional
     :param vg_name: The name of the vertex group to use for the decimation, defaults to None.
     :type vg_name: str, optional
-    :param merge_threshold: The threshold for merging vertices between iterations, defaults to 0.0005.
+    :param merge_threshold: The threshold for merging vertices after the decimation, defaults to 0.0001.
     :type merge_threshold: float, optional
+    :param min_reduction: Reductions below this fraction of the faces are skipped, defaults to 0.005 (0.5%).
+    :type min_reduction: float, optional
     :return: The decimated Blender object.
     :rtype: bpy.types.Object
     """
@@ -810,69 +1166,57 @@ def decimate_object(mesh_data, target_ratio, iterations=5, vg_name=None, merge_t
     max_dimension = max(mesh_data.dimensions)
     merge_distance = max_dimension * merge_threshold # Adjust the factor as needed
 
-    # Get the initial vertex count
-    initial_vertex_count = len(mesh_data.data.vertices)
-    current_face_count = len(mesh_data.data.polygons)
-    target_face_count = current_face_count * target_ratio
-
-    # Initialize cumulative ratio
-    cumulative_ratio = 1.0
+    if 1.0 - target_ratio < min_reduction:
+        print(f"Skipping decimation, reduction below {min_reduction:.1%}: {len(mesh_data.data.polygons)} faces.")
+        return mesh_data  # Not worth running the decimate solver, return early.
 
-    for iteration in range(1, iterations + 1):
-        if current_face_count <= target_face_count:
-            print(f"Target face count reached: {current_face_count} faces.")
-            break  # Target reached already, return early.
+    target_face_count = int(len(mesh_data.data.polygons) * target_ratio)
 
-        # Normalize the current iteration to a value between 0 and 1
-        t = iteration / iterations
+    # Add a single decimate modifier to the object
+    decimate_modifier = mesh_data.modifiers.new(name="Decimate", type="DECIMATE")
+    decimate_modifier.ratio = max(target_ratio, 0.0001)
+    decimate_modifier.use_collapse_triangulate = True
 
-        # Apply the cubic easing function to smooth the decimation progress
-        eased_t = cubic_ease_out(t)
-
-        # Compute the desired cumulative ratio for this iteration
-        desired_cumulative_ratio = 1 - eased_t * (1 - target_ratio)
-
-        # Adjust per-step ratio based on actual cumulative ratio achieved so far
-        per_step_ratio = desired_cumulative_ratio / cumulative_ratio
+    # Set vertex group and inversion if specified, preferring the precomputed complement over inverting
+    if vg_name:
+        interior_vg = mesh_data.vertex_groups.get(f"{vg_name}{INTERIOR_VG_SUFFIX}")
+        if interior_vg is not None:
+            decimate_modifier.vertex_group = interior_vg.name
+        else:
+            decimate_modifier.vertex_group = vg_name
+            decimate_modifier.invert_vertex_group = True
 
-        # Ensure the per-step ratio does not drop below a minimum threshold
-        per_step_ratio = max(per_step_ratio, 0.0001)
+    # Apply the decimate modifier. Evaluating it through the depsgraph and swapping in the resulting mesh avoids the
+    # poll, undo push and context handling of the operator. This would bake any other modifier into the mesh as well,
+    # so objects which already carry modifiers still go through the operator.
+    if len(mesh_data.modifiers) == 1:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        decimated_mesh = bpy.data.meshes.new_from_object(mesh_data.evaluated_get(depsgraph),
+                                                         preserve_all_data_layers=True, depsgraph=depsgraph)
+        mesh_data.modifiers.remove(decimate_modifier)
+
+        original_mesh = mesh_data.data
+        mesh_name = original_mesh.name
+        mesh_data.data = decimated_mesh
+
+        if original_mesh.users == 0:
+            bpy.data.meshes.remove(original_mesh)
+            decimated_mesh.name = mesh_name
+    else:
+        with bpy.context.temp_override(object=mesh_data):
+            bpy.ops.object.modifier_apply(modifier=decimate_modifier.name)
 
-        # Add a decimate modifier to the object
-        decimate_modifier = mesh_data.modifiers.new(name=f"Decimate_{iteration}", type="DECIMATE")
-        decimate_modifier.ratio = per_step_ratio
-        decimate_modifier.use_collapse_triangulate = True
+    # Merge by distance (remove doubles)
+    mesh_data = merge_doubles(mesh_data, merge_distance, return_bm=False)
 
-        # Set vertex group and inversion if specified
-        if vg_name:
-            decimate_modifier.vertex_group = vg_name
-            decimate_modifier.invert_vertex_group = True
+    # Remove the faces the decimation left above the target from flat areas, keeping the preserved vertices in place
+    current_face_count = len(mesh_data.data.polygons)
+    if current_face_count > target_face_count:
+        simplify_flat_areas(mesh_data, target_face_count=target_face_count, curvature_threshold=0.01,
+                            vertex_group_name=vg_name)
+        print(f"Removed an additional {current_face_count - len(mesh_data.data.polygons)} faces.")
 
-        # Apply the decimate modifier
-        bpy.ops.object.modifier_apply(modifier=decimate_modifier.name)
-
-        # Merge by distance (remove doubles)
-        mesh_data = merge_doubles(mesh_data, merge_distance, return_bm=False)
-
-        # Update the cumulative ratio based on the actual vertex count
-        current_vertex_count = len(mesh_data.data.vertices)
-        current_face_count = len(mesh_data.data.polygons)
-        cumulative_ratio = current_vertex_count / initial_vertex_count
-
-        # Print debug information
-        print(f"Iteration {iteration}/{iterations}:")
-        print(f"  Desired Cumulative Ratio: {desired_cumulative_ratio:.6f}")
-        print(f"  Actual Cumulative Ratio: {cumulative_ratio:.6f}")
-        print(f"  Per-Step Ratio Used: {per_step_ratio:.6f}")
-        print(f"  Vertex Count: {current_vertex_count}")
-        print(f"  Face Count: {current_face_count}")
-
-        if target_face_count < current_face_count and iteration < iterations:
-            face_target = int(target_face_count * target_ratio)
-            simplify_flat_areas(mesh_data, face_target, 0.01, vg_name)
-            old_curr_face_ct = current_face_count
-            current_face_count = len(mesh_data.data.polygons)
-            print(f"Removed an additional {old_curr_face_ct - current_face_count} faces.")
+    print(f"Decimated to {len(mesh_data.data.vertices)} vertices and {len(mesh_data.data.polygons)} faces.")
 
     return mesh_data
 
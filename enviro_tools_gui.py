@@ -1,10 +1,19 @@
 import os
 import sys
+import json
 import time
+import shutil
+import tempfile
+import threading
+import subprocess
 import importlib.util
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from importlib.metadata import distribution, PackageNotFoundError
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QProcess, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton,
@@ -26,24 +35,238 @@ PLUGIN_DIR = os.path.join(SCRIPT_DIR, PLUGIN_BASENAME)
 
 REQUIERED_MODULES = ("bpy", "numpy", "xatlas", "pyfqmr")
 
+# Command line argument that runs this script as the pipeline process, followed by the values as JSON
+PIPELINE_ARG = "--pipeline"
 
-def calculate_polycount(file_path):
+# Read once on import, so constructing another window does not touch the disk again
+with open(os.path.join(SCRIPT_DIR, "style.qss"), "r") as f:
+    STYLE_SHEET = f.read()
+
+PARALLEL_POLYCOUNT_SIZE = 64 << 20  # Files from this size on (in bytes) are scanned in parallel
+POLYCOUNT_WORKERS = min(4, os.cpu_count() or 1)
+POLYCOUNT_CACHE_SIZE = 32
+
+# Polygon and vertex counts of recently selected files by (path, modification time, size), least recently used first
+_POLYCOUNT_CACHE = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def _dist_version(module_name):
+    """
+    Looks up the version of an installed distribution. The result is cached for the lifetime of the process,
+    as reading the package metadata scans every entry of sys.path.
+    :param module_name: The name of the distribution
+    :type module_name: str
+    :return: The version of the distribution, or None if no metadata was found
+    :rtype: str or None
+    """
+    try:
+        return distribution(module_name).version
+    except PackageNotFoundError:
+        return None
+
+
+def _open_folder(path):
     """
-    Calculates the number of polygons in a .obj file
+    Opens a folder in the platform's file browser.
+    :param path: The folder to open
+    :type path: str
+    """
+    if sys.platform == "win32":
+        os.startfile(path)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["open", path])
+    else:
+        subprocess.Popen(["xdg-open", path])
+
+
+def open_folder(path):
+    """
+    Opens a folder in the platform's file browser on a background thread, as launching the shell handler
+    can take a moment and should not delay the GUI.
+    :param path: The folder to open
+    :type path: str
+    """
+    threading.Thread(target=_open_folder, args=(path,), daemon=True).start()
+
+
+def _count_obj_lines(file_path, start, end):
+    """
+    Counts the face and vertex lines of a .obj file, whose preceding newline lies in the byte range [start, end).
     :param file_path: The path to the .obj file
     :type file_path: str
-    :return: The number of polygons
-    :rtype: int
+    :param start: The first byte of the range
+    :type start: int
+    :param end: The end of the range (exclusive)
+    :type end: int
+    :return: The number of face lines and the number of vertex lines
+    :rtype: tuple[int, int]
+    """
+    # Read two bytes past the range, so a match starting at its last byte is complete.
+    # The chunks are read into one reused buffer, so no new bytes object is allocated per chunk.
+    remaining = end - start + 2
+    face_count = 0
+    vertex_count = 0
+    carry = b""
+    chunk = bytearray(min(1 << 20, remaining))
+    with open(file_path, "rb", buffering=0) as file:
+        file.seek(start)
+        while remaining > 0:
+            size = file.readinto(memoryview(chunk)[:remaining])
+            if not size:
+                break
+            remaining -= size
+
+            # Count the matches spanning the previous chunk's tail and this chunk's head separately.
+            # Both counts run over the same chunk while it is still in cache.
+            seam = carry + chunk[:min(size, 2)]
+            face_count += seam.count(b"\nf ") + chunk.count(b"\nf ", 0, size)
+            vertex_count += seam.count(b"\nv ") + chunk.count(b"\nv ", 0, size)
+            carry = bytes(chunk[max(size - 2, 0):size])
+    return face_count, vertex_count
+
+
+def calculate_obj_counts(file_path):
+    """
+    Calculates the number of polygons and vertices in a .obj file in a single pass
+    :param file_path: The path to the .obj file
+    :type file_path: str
+    :return: The number of polygons and the number of vertices
+    :rtype: tuple[int, int]
     """
     if not os.path.isfile(file_path):
-        return 0
+        return 0, 0
+
+    # Reselecting an unchanged file is answered from the cache
+    file_stat = os.stat(file_path)
+    file_size = file_stat.st_size
+    cache_key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_size)
+    if cache_key in _POLYCOUNT_CACHE:
+        _POLYCOUNT_CACHE.move_to_end(cache_key)
+        return _POLYCOUNT_CACHE[cache_key]
+
+    # Every face or vertex line except a very first one starts after a newline
+    with open(file_path, "rb") as file:
+        first_line = file.read(2)
+    polycount = int(first_line == b"f ")
+    vertex_count = int(first_line == b"v ")
+
+    if file_size < PARALLEL_POLYCOUNT_SIZE:
+        face_lines, vertex_lines = _count_obj_lines(file_path, 0, file_size)
+    else:
+        # Scan large files in parallel ranges, one thread reads while another counts
+        bounds = [file_size * i // POLYCOUNT_WORKERS for i in range(POLYCOUNT_WORKERS + 1)]
+        with ThreadPoolExecutor(max_workers=POLYCOUNT_WORKERS) as executor:
+            counts = list(executor.map(_count_obj_lines, repeat(file_path), bounds[:-1], bounds[1:]))
+        face_lines = sum(faces for faces, _ in counts)
+        vertex_lines = sum(vertices for _, vertices in counts)
+
+    counts = (polycount + face_lines, vertex_count + vertex_lines)
+    _POLYCOUNT_CACHE[cache_key] = counts
+    if len(_POLYCOUNT_CACHE) > POLYCOUNT_CACHE_SIZE:
+        _POLYCOUNT_CACHE.popitem(last=False)
+
+    return counts
+
+
+class PolycountSignals(QObject):
+    """Signals of the :class:`PolycountWorker`."""
+    # The file path, its polycount and vertex count. The counts are passed as object, as they may exceed a 32-bit int.
+    finished = Signal(str, object, object)
+
+
+class PolycountWorker(QRunnable):
+    """Calculates the polygon and vertex count of a .obj file on the thread pool, so the GUI stays responsive."""
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = PolycountSignals()
 
-    polycount = 0
-    with open(file_path, "r") as file:
-        for line in file:
-            if line.startswith("f "):
-                polycount += 1
-    return polycount
+    def run(self):
+        self.signals.finished.emit(self.file_path, *calculate_obj_counts(self.file_path))
+
+
+def setup_blender(values):
+    """
+    Set up a clean Blender Scene with the provided configuration values.
+    Runs in the pipeline process, so it reports errors instead of showing them.
+    :param values: A dictionary containing configuration values for the Blender setup.
+    :type values: dict
+    :returns: A message describing why the setup failed, or None on success.
+    :rtype: str or None
+    """
+    import bpy
+
+    # Create a new scene
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    # Check if the plugin is installed
+    if PLUGIN_BASENAME not in bpy.context.preferences.addons.keys():
+        print(f"{PLUGIN_BASENAME} not installed. Attempting install.")
+        # Create a .zip file for the plugin if not already existing or older than its sources
+        if deploy.is_zip_stale(PLUGIN_DIR):
+            deploy.zip_directory(PLUGIN_DIR)
+
+        if not os.path.isfile(PLUGIN_FILE):
+            return "Failed to create plugin. Can NOT continue"
+
+        # Install the plugin
+        bpy.ops.preferences.addon_install(filepath=PLUGIN_FILE)
+    else:
+        print(f"{PLUGIN_BASENAME} already installed")
+
+    # Check if the plugin is enabled
+    if PLUGIN_BASENAME not in bpy.context.preferences.addons:
+        print(f"{PLUGIN_BASENAME} not enabled. Enabling...")
+        bpy.ops.preferences.addon_enable(module=PLUGIN_BASENAME)
+    else:
+        print(f"{PLUGIN_BASENAME} already enabled.")
+
+    if PLUGIN_BASENAME not in bpy.context.preferences.addons:
+        return "Failed to enable plugin. Can NOT continue"
+
+    # Run the pipeline
+    bpy.types.Scene.import_fp_comb = values["highpoly_model_path"]
+    bpy.types.Scene.rot_correction_comb = values["rot_correction"]
+    bpy.types.Scene.export_fp_comb = values["export_path"]
+
+    bpy.types.Scene.initial_reduction_comb = values["initial_reduction_polycount"]
+    bpy.types.Scene.loose_threshold_comb = values["loose_threshold"]
+    bpy.types.Scene.boundary_length_comb = values["boundary_length"]
+    bpy.types.Scene.merge_threshold_comb = values["merge_threshold"]
+
+    bpy.types.Scene.num_of_modules_comb = values["num_modules"]
+
+    bpy.types.Scene.lod_count_comb = values["num_lods"]
+    bpy.types.Scene.reduction_percentage_comb = values["reduction_percentage"]
+
+    baker_settings = bpy.data.scenes["Scene"].baker_settings_comb
+    baker_settings.highpoly_mesh_name = values["highpoly_model_path"]
+    baker_settings.render_device = values["render_device"]
+    baker_settings.texture_resolution = values["texture_resolution"]
+    baker_settings.lower_res_by_lod = values["lower_res_by_lod"]
+    baker_settings.save_path = values["export_path"]
+    baker_settings.ray_distance = values["ray_distance"]
+    return None
+
+
+def run_pipeline(values):
+    """
+    Sets up Blender and runs the combined LOD pipeline. Called in a separate process (see :data:`PIPELINE_ARG`),
+    so bpy is only ever used from the main thread of the process that imported it.
+    :param values: A dictionary containing configuration values for the Blender setup.
+    :type values: dict
+    :return: The exit code of the process
+    :rtype: int
+    """
+    error = setup_blender(values)
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    # Run the operators
+    launch_operator_by_name(COMB_IDNAME)
+    return 0
 
 
 class ModelProcessorGUI(QWidget):
@@ -57,11 +280,12 @@ class ModelProcessorGUI(QWidget):
 
         self.module_installers = {}
         self.module_statuses = {}
+        self.polycount_worker = None
+        self.pipeline_process = None
+        self.pipeline_start_time = 0.0
 
         self.setWindowIcon(QIcon("elt_icon.png"))
-        with open("style.qss", "r") as f:
-            _style = f.read()
-            app.setStyleSheet(_style)
+        app.setStyleSheet(STYLE_SHEET)
 
         # Content
 
@@ -149,7 +373,9 @@ class ModelProcessorGUI(QWidget):
         slice_layout = QVBoxLayout()
 
         self.num_modules = QComboBox()
-        self.num_modules.addItems(["1", "4", "9", "16", "64", "256"])
+        # Each item carries its value as int, so it needs no parsing on start
+        for num_modules in (1, 4, 9, 16, 64, 256):
+            self.num_modules.addItem(str(num_modules), num_modules)
         self.num_modules.setCurrentText("16")
         num_modules_layout = QHBoxLayout()
         num_modules_layout.addWidget(QLabel("Number of Modules"))
@@ -202,7 +428,8 @@ class ModelProcessorGUI(QWidget):
         lower_res_by_lod_layout.addWidget(self.lower_res_by_lod)
 
         self.texture_resolution = QComboBox()
-        self.texture_resolution.addItems(["256", "512", "1024", "2048", "4096", "8192"])
+        for texture_resolution in (256, 512, 1024, 2048, 4096, 8192):
+            self.texture_resolution.addItem(str(texture_resolution), texture_resolution)
         self.texture_resolution.setCurrentText("1024")
         texture_resolution_layout = QHBoxLayout()
         texture_resolution_layout.addWidget(QLabel("Texture Resolution"))
@@ -224,8 +451,8 @@ class ModelProcessorGUI(QWidget):
         bake_group.setLayout(bake_layout)
 
         # Start Button
-        start_btn = QPushButton("Start")
-        start_btn.clicked.connect(self.start_pipeline)
+        self.start_btn = QPushButton("Start")
+        self.start_btn.clicked.connect(self.start_pipeline)
 
         module_found_layout = QHBoxLayout()
         module_found_layout.setAlignment(Qt.AlignCenter)
@@ -248,7 +475,7 @@ class ModelProcessorGUI(QWidget):
         layout.addWidget(slice_group)
         layout.addWidget(lod_group)
         layout.addWidget(bake_group)
-        layout.addWidget(start_btn)
+        layout.addWidget(self.start_btn)
         layout.addLayout(module_found_layout)
 
         self.setLayout(layout)
@@ -272,10 +499,9 @@ class ModelProcessorGUI(QWidget):
             module_spec = importlib.util.find_spec(module_name)
             if module_spec is not None:
                 # Module is available in sys.path
-                try:
-                    # Try to get distribution information from installed package metadata
-                    version = distribution(module_name).version
-                except PackageNotFoundError:
+                # Try to get distribution information from installed package metadata
+                version = _dist_version(module_name)
+                if version is None:
                     # If distribution info is not available, attempt to get version from the module's __version__ attribute
                     module = importlib.import_module(module_name)
                     version = getattr(module, "__version__", None)
@@ -314,9 +540,9 @@ class ModelProcessorGUI(QWidget):
         label_name = module_name + "_found_label"
 
         if success:
-            # Re-check the module to update the label
-            dist = distribution(module_name)
-            version = dist.version
+            # Re-check the module to update the label, the cached lookup predates the installation
+            _dist_version.cache_clear()
+            version = _dist_version(module_name) or "undefined"
             getattr(self, label_name).setText(f"{module_name} {version}")
             getattr(self, label_name).setStyleSheet("color: green;")
             self.module_statuses[module_name] = 'installed'
@@ -337,15 +563,35 @@ class ModelProcessorGUI(QWidget):
 
             if not os.path.exists(mtl_path):
                 QMessageBox.warning(self, "Warning", "No .mtl file found alongside the .obj file.")
-
-            # Check texture references in .mtl file
-            if os.path.exists(mtl_path):
+            else:
+                # Check texture references in .mtl file
                 self.check_texture_references(mtl_path, os.path.dirname(file_path))
 
     def update_polycount(self, file_path):
-        """Update the polygon count display and settings based on the selected model file."""
-        polycount = calculate_polycount(file_path)
-        self.polycount_label.setText(f"Polycount: {str(polycount)}")
+        """Start counting the polygons of the selected model file in the background."""
+        self.polycount_label.setText("Polycount: Counting...")
+
+        # Keep a reference to the worker, so its signals stay alive until the result is delivered
+        self.polycount_worker = PolycountWorker(file_path)
+        self.polycount_worker.signals.finished.connect(self.on_polycount_finished)
+        QThreadPool.globalInstance().start(self.polycount_worker)
+
+    def on_polycount_finished(self, file_path, polycount, vertex_count):
+        """
+        Slot to update the polygon count display and settings, once the polycount of a model file is known.
+
+        :param file_path: The path of the model file that was counted.
+        :type file_path: str
+        :param polycount: The number of polygons in the model file.
+        :type polycount: int
+        :param vertex_count: The number of vertices in the model file.
+        :type vertex_count: int
+        """
+        # Ignore results of a previously selected file
+        if file_path != self.highpoly_model_line_edit.text():
+            return
+
+        self.polycount_label.setText(f"Polycount: {polycount} | Vertices: {vertex_count}")
         self.initial_reduction_polycount.setRange(0, polycount)
         self.initial_reduction_polycount.setValue(polycount)
 
@@ -360,41 +606,56 @@ class ModelProcessorGUI(QWidget):
         :return:
         """
         changes = []
-        with open(mtl_path, "r") as file:
-            lines = file.readlines()
-
-        for i, line in enumerate(lines):
-            if line.startswith("map_Kd"):  # Assuming 'map_Kd' indicates a texture file
-                texture_file = line.split()[1]
-                texture_path = os.path.join(directory, texture_file)
-                if not os.path.exists(texture_path):
-                    new_texture_path = self.find_texture_file(directory, texture_file)
-                    if new_texture_path:
-                        lines[i] = f"map_Kd {new_texture_path}\n"
-                        changes.append((texture_file, new_texture_path))
-
-        if changes:
-            with open(mtl_path, "w") as file:
-                file.writelines(lines)
+        texture_index = None
+
+        # List the directory once, so plain file names are checked without a stat call per reference
+        with os.scandir(directory) as entries:
+            directory_names = {entry.name for entry in entries}
+
+        # Stream the file into a temporary file next to it, which only replaces it if a reference changed
+        with open(mtl_path, "r") as src, tempfile.NamedTemporaryFile("w", dir=os.path.dirname(mtl_path),
+                                                                    delete=False) as dst:
+            for line in src:
+                if line.startswith("map_Kd"):  # Assuming 'map_Kd' indicates a texture file
+                    texture_file = line.split()[1]
+                    if os.path.basename(texture_file) == texture_file:
+                        texture_found = texture_file in directory_names
+                    else:
+                        texture_found = os.path.exists(os.path.join(directory, texture_file))
+                    if not texture_found:
+                        # Walk the directory only once, on the first missing texture
+                        if texture_index is None:
+                            texture_index = self.index_texture_files(directory)
+                        new_texture_path = texture_index.get(texture_file)
+                        if new_texture_path:
+                            line = f"map_Kd {new_texture_path}\n"
+                            changes.append((texture_file, new_texture_path))
+                dst.write(line)
+
+        if not changes:
+            os.unlink(dst.name)
+        else:
+            shutil.copymode(mtl_path, dst.name)  # Temporary files are created private, keep the original permissions
+            os.replace(dst.name, mtl_path)
             change_report = "\n".join([f"{old} -> {new}" for old, new in changes])
             QMessageBox.information(self, "Texture Paths Updated", f"Updated texture paths:\n{change_report}")
 
     @staticmethod
-    def find_texture_file(directory, filename):
+    def index_texture_files(directory):
         """
-        Search for a texture file in the given directory and its subdirectories.
+        Index all files in the given directory and its subdirectories by their name, to look up texture files.
+        If a name occurs more than once, the first file found in the top-down walk is kept.
 
         :param directory: The root directory to start the search.
         :type directory: str
-        :param filename: The name of the texture file to find.
-        :type filename: str
-        :returns: The relative path to the found texture file or None if not found.
-        :rtype: str or None
+        :returns: The relative path of each file by its name.
+        :rtype: dict[str, str]
         """
+        index = {}
         for root, _, files in os.walk(directory):
-            if filename in files:
-                return os.path.relpath(os.path.join(root, filename), directory)
-        return None
+            for filename in files:
+                index.setdefault(filename, os.path.relpath(os.path.join(root, filename), directory))
+        return index
 
     def select_export_path(self):
         """Open a dialog to select an export directory and update the corresponding UI element."""
@@ -404,70 +665,12 @@ class ModelProcessorGUI(QWidget):
             if os.listdir(directory):
                 QMessageBox.warning(self, "Warning", "The selected export folder is not empty.")
 
-    def setup_blender(self, values):
-        """
-        Set up a clean Blender Scene with the provided configuration values.
-        :param values: A dictionary containing configuration values for the Blender setup.
-        :type values: dict
-        :returns: None
-        """
-        import bpy
-
-        # Create a new scene
-        bpy.ops.wm.read_factory_settings(use_empty=True)
-
-        # Check if the plugin is installed
-        if PLUGIN_BASENAME not in bpy.context.preferences.addons.keys():
-            print(f"{PLUGIN_BASENAME} not installed. Attempting install.")
-            # Create a .zip file for the plugin if not already existing
-            if not os.path.isfile(PLUGIN_FILE):
-                deploy.zip_directory(PLUGIN_DIR)
-
-            if not os.path.isfile(PLUGIN_FILE):
-                QMessageBox.critical(self, "Error", "Failed to create plugin. Can NOT continue")
-                return
-
-            # Install the plugin
-            bpy.ops.preferences.addon_install(filepath=PLUGIN_FILE)
-        else:
-            print(f"{PLUGIN_BASENAME} already installed")
-
-        # Check if the plugin is enabled
-        if PLUGIN_BASENAME not in bpy.context.preferences.addons:
-            print(f"{PLUGIN_BASENAME} not enabled. Enabling...")
-            bpy.ops.preferences.addon_enable(module=PLUGIN_BASENAME)
-        else:
-            print(f"{PLUGIN_BASENAME} already enabled.")
-
-        if PLUGIN_BASENAME not in bpy.context.preferences.addons:
-            QMessageBox.critical(self, "Error", "Failed to enable plugin. Can NOT continue")
+    def start_pipeline(self):
+        """Starts the pipeline with the current configuration values in a separate process."""
+        if self.pipeline_process is not None:
+            QMessageBox.warning(self, "Pipeline Running", "Please wait for the running pipeline to complete.")
             return
 
-        # Run the pipeline
-        bpy.types.Scene.import_fp_comb = values["highpoly_model_path"]
-        bpy.types.Scene.rot_correction_comb = values["rot_correction"]
-        bpy.types.Scene.export_fp_comb = values["export_path"]
-
-        bpy.types.Scene.initial_reduction_comb = values["initial_reduction_polycount"]
-        bpy.types.Scene.loose_threshold_comb = values["loose_threshold"]
-        bpy.types.Scene.boundary_length_comb = values["boundary_length"]
-        bpy.types.Scene.merge_threshold_comb = values["merge_threshold"]
-
-        bpy.types.Scene.num_of_modules_comb = values["num_modules"]
-
-        bpy.types.Scene.lod_count_comb = values["num_lods"]
-        bpy.types.Scene.reduction_percentage_comb = values["reduction_percentage"]
-
-        bpy.data.scenes["Scene"].baker_settings_comb.highpoly_mesh_name = values["highpoly_model_path"]
-        bpy.data.scenes["Scene"].baker_settings_comb.render_device = values["render_device"]
-        bpy.data.scenes["Scene"].baker_settings_comb.texture_resolution = values["texture_resolution"]
-        bpy.data.scenes["Scene"].baker_settings_comb.lower_res_by_lod = values["lower_res_by_lod"]
-        bpy.data.scenes["Scene"].baker_settings_comb.save_path = values["export_path"]
-        bpy.data.scenes["Scene"].baker_settings_comb.ray_distance = values["ray_distance"]
-
-    def start_pipeline(self):
-        """Starts the pipeline with the current configuration values."""
-        start_time = time.time()
         if self.module_installers:
             QMessageBox.warning(self, "Installation in Progress",
                                 "Please wait for module installations to complete before starting the pipeline.")
@@ -500,11 +703,11 @@ class ModelProcessorGUI(QWidget):
         vertex_threshold = self.loose_comp_threshold.value()
         boundary_length = self.boundary_length.value()
         merge_threshold = self.merge_threshold.value()
-        num_modules = int(self.num_modules.currentText())
+        num_modules = self.num_modules.currentData()
         num_lods = self.num_lods.value()
         reduction_percentage = self.reduction_percentage.value()
         render_device = self.render_device.currentText()
-        texture_resolution = int(self.texture_resolution.currentText())
+        texture_resolution = self.texture_resolution.currentData()
         lower_res_by_lod = self.lower_res_by_lod.isChecked()
         ray_distance = self.ray_distance.value()
 
@@ -525,20 +728,73 @@ class ModelProcessorGUI(QWidget):
             "rot_correction": rot_correction
         }
 
-        self.setup_blender(values)
+        self.start_btn.setEnabled(False)
+        self.start_btn.setText("Processing...")
+
+        # bpy is neither thread-safe nor meant to run its operators off the main thread, so the pipeline runs in its
+        # own process. Its output is forwarded to the console, its errors are collected for the report.
+        self.pipeline_start_time = time.time()
+        self.pipeline_process = QProcess(self)
+        self.pipeline_process.setProcessChannelMode(QProcess.ForwardedOutputChannel)
+        self.pipeline_process.setWorkingDirectory(SCRIPT_DIR)
+        self.pipeline_process.finished.connect(
+            lambda exit_code, exit_status: self.on_pipeline_finished(export_path, exit_code, exit_status))
+        self.pipeline_process.errorOccurred.connect(self.on_pipeline_error)
+        self.pipeline_process.start(sys.executable, [os.path.abspath(__file__), PIPELINE_ARG, json.dumps(values)])
+
+    def on_pipeline_finished(self, export_path, exit_code, exit_status):
+        """
+        Slot to handle the end of the pipeline process.
+
+        :param export_path: The folder the LODs were exported to.
+        :type export_path: str
+        :param exit_code: The exit code of the pipeline process.
+        :type exit_code: int
+        :param exit_status: Whether the pipeline process exited normally or crashed.
+        :type exit_status: QProcess.ExitStatus
+        """
+        errors = bytes(self.pipeline_process.readAllStandardError()).decode(errors="replace").strip()
+        self.release_pipeline_process()
 
-        # Run the operators
-        launch_operator_by_name(COMB_IDNAME)
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            # The last line holds the setup error or the exception that ended the process
+            message = errors.splitlines()[-1] if errors else f"Pipeline exited with code {exit_code}."
+            QMessageBox.critical(self, "Error", message)
+            return
 
         # Open the export folder
-        os.startfile(export_path)
+        open_folder(export_path)
 
-        end_time = time.time()
         QMessageBox.information(self, "Processing Done",
-                                f"Processing completed in {end_time - start_time:.2f} seconds.")
+                                f"Processing completed in {time.time() - self.pipeline_start_time:.2f} seconds.")
+
+    def on_pipeline_error(self, error):
+        """
+        Slot to handle a pipeline process that could not be started. Other errors end in :meth:`on_pipeline_finished`.
+
+        :param error: The error of the pipeline process.
+        :type error: QProcess.ProcessError
+        """
+        if error != QProcess.FailedToStart:
+            return
+
+        message = self.pipeline_process.errorString()
+        self.release_pipeline_process()
+        QMessageBox.critical(self, "Error", f"Failed to start the pipeline: {message}")
+
+    def release_pipeline_process(self):
+        """Release the pipeline process and re-enable the start button."""
+        self.pipeline_process.deleteLater()
+        self.pipeline_process = None
+        self.start_btn.setText("Start")
+        self.start_btn.setEnabled(True)
 
 
 if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == PIPELINE_ARG:
+        # Started by the GUI as the pipeline process
+        sys.exit(run_pipeline(json.loads(sys.argv[2])))
+
     app = QApplication(sys.argv)
     window = ModelProcessorGUI()
     window.show()